@@ -1,16 +1,76 @@
 import pandas as pd
-import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
-from matplotlib.gridspec import GridSpec
 import os
+import re
+import mmap
+import functools
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import glob
 
-# Set style
-plt.style.use('ggplot')
-sns.set_palette("colorblind")
-plt.rcParams['font.size'] = 12
-plt.rcParams['figure.figsize'] = (12, 8)
+# pyarrow is optional; when installed it backs the faster CSV reader
+try:
+    import pyarrow
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+# matplotlib/seaborn are imported on first use (see _figure) since their import
+# and style setup dominate startup when only one plot is needed. The figure
+# itself is created once and cleared for each plot.
+_fig = None
+
+def _figure(figsize):
+    """Return the shared Agg-backed figure, cleared and resized to figsize.
+    
+    The figure is built directly rather than through pyplot, so it is never
+    registered with pyplot's figure manager and needs no plt.close(). Plot
+    functions must finish saving before the next one calls _figure().
+    """
+    global _fig
+    if _fig is None:
+        import matplotlib
+        # Output only goes to files, so use the non-interactive backend
+        matplotlib.use('Agg')
+        import seaborn as sns
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        
+        # Set style
+        matplotlib.style.use('ggplot')
+        sns.set_palette("colorblind")
+        matplotlib.rcParams['font.size'] = 12
+        matplotlib.rcParams['figure.figsize'] = (12, 8)
+        
+        _fig = Figure(figsize=figsize)
+        FigureCanvasAgg(_fig)
+    else:
+        # Reuse the canvas and renderer; only the artists are discarded
+        _fig.clear()
+        _fig.set_size_inches(figsize)
+    return _fig
+
+# Resolution and PNG encoder settings for saved figures. Figures are laid out
+# with tight_layout, so savefig skips the extra bbox_inches='tight' draw, and
+# zlib level 1 keeps encoding cheap at the cost of slightly larger files.
+FIGURE_DPI = 150
+SAVEFIG_KWARGS = {'dpi': FIGURE_DPI, 'pil_kwargs': {'compress_level': 1}}
+
+# Operation count suffix of result files, e.g. operations_1000.csv or run_500.log
+OP_COUNT_PATTERN = re.compile(r'_(\d+)\.\w+$')
+
+# A stash history value: an integer with at most one leading sign
+INTEGER_LINE_PATTERN = re.compile(rb'[+-]?\d+')
+
+def _read_csv(file_path):
+    """Read a CSV with the pyarrow engine when available, else the C engine."""
+    if HAS_PYARROW:
+        try:
+            return pd.read_csv(file_path, engine='pyarrow')
+        except ValueError:
+            # pyarrow rejects ragged rows such as short 'ERROR: ...' lines;
+            # the C engine pads them with NaN
+            pass
+    return pd.read_csv(file_path)
 
 def load_and_clean_data(file_path):
     """Load a CSV file and handle potential formatting issues."""
@@ -20,25 +80,24 @@ def load_and_clean_data(file_path):
             print(f"Warning: File {file_path} not found.")
             return None
             
-        # For files with 'Metric,Value' format
-        if 'operations_' in file_path or 'baseline_' in file_path or 'privacy_' in file_path or 'config_th' in file_path:
-            df = pd.read_csv(file_path)
+        # For files with 'Metric,Value' format; only the file name is
+        # tested, so a directory such as baseline_runs/ does not match
+        file_name = os.path.basename(file_path)
+        if 'operations_' in file_name or 'baseline_' in file_name or 'privacy_' in file_name or 'config_th' in file_name:
+            df = _read_csv(file_path)
             # Convert to key-value pairs if needed
             if 'Metric' in df.columns and 'Value' in df.columns:
-                # Extract metrics into a dictionary
-                metrics = {}
-                for _, row in df.iterrows():
-                    try:
-                        # Try to convert to float if possible
-                        metrics[row['Metric']] = float(row['Value'])
-                    except (ValueError, TypeError):
-                        # Keep as string if not convertible
-                        metrics[row['Metric']] = row['Value']
-                return pd.Series(metrics)
+                # Convert values to float where possible, keeping the
+                # original string for anything that isn't numeric
+                numeric = pd.to_numeric(df['Value'], errors='coerce')
+                values = numeric.astype(object).where(numeric.notna(), df['Value'])
+                metrics = pd.Series(values.to_numpy(), index=df['Metric'].to_numpy())
+                # Later duplicates win, as they did when building a dict
+                return metrics[~metrics.index.duplicated(keep='last')]
             return df
         # For other formats
         else:
-            return pd.read_csv(file_path)
+            return _read_csv(file_path)
     except Exception as e:
         print(f"Error loading {file_path}: {e}")
         return None
@@ -53,40 +112,40 @@ def plot_baseline_comparison(baseline_comp_path='baseline_comparison.csv'):
         print("No data found for baseline comparison")
         return
     
-    fig = plt.figure(figsize=(16, 10))
-    gs = GridSpec(2, 3, figure=fig)
+    fig = _figure((16, 10))
+    gs = fig.add_gridspec(2, 3)
+    
+    # Baseline/Privacy column pairs are drawn as grouped bars by pandas,
+    # one group per index entry (width is per bar, groups span two bars)
+    by_op_count = df.set_index('OperationCount')
+    width = 0.35
     
     # Plot 1: Throughput comparison
     ax1 = fig.add_subplot(gs[0, 0])
-    x = df['OperationCount'].astype(str)
-    width = 0.35
-    ax1.bar(np.arange(len(x)) - width/2, df['BaselineThroughput'], width, label='Baseline')
-    ax1.bar(np.arange(len(x)) + width/2, df['PrivacyThroughput'], width, label='Privacy')
+    throughput = by_op_count[['BaselineThroughput', 'PrivacyThroughput']]
+    throughput.set_axis(['Baseline', 'Privacy'], axis=1).plot.bar(
+        ax=ax1, width=2*width, rot=0, logy=True)  # Log scale due to large differences
     ax1.set_xlabel('Operation Count')
     ax1.set_ylabel('Throughput (ops/sec)')
     ax1.set_title('Throughput Comparison')
-    ax1.set_xticks(np.arange(len(x)))
-    ax1.set_xticklabels(x)
     ax1.legend()
-    ax1.set_yscale('log')  # Log scale due to large differences
     
     # Plot 2: Latency comparisons
     ax2 = fig.add_subplot(gs[0, 1])
     metrics = ['InterestLatency', 'DataLatency', 'RetrievalLatency']
     
-    width = 0.35
-    ind = np.arange(len(metrics))
+    implementations = ['Baseline', 'Privacy']
+    # Columns keyed by (implementation, latency type), one row per op count
+    latencies = df[[f'{impl}{m}' for impl in implementations for m in metrics]]
+    latencies.columns = pd.MultiIndex.from_product([implementations, metrics])
     
     # Use the first operation count (usually smaller for better visibility)
     op_idx = 0
-    ax2.bar(ind - width/2, [df[f'Baseline{m}'].iloc[op_idx] for m in metrics], width, label='Baseline')
-    ax2.bar(ind + width/2, [df[f'Privacy{m}'].iloc[op_idx] for m in metrics], width, label='Privacy')
+    latencies.iloc[op_idx].unstack(0).reindex(metrics).plot.bar(ax=ax2, width=2*width, rot=0)
     
     ax2.set_xlabel('Latency Type')
     ax2.set_ylabel('Latency (μs)')
     ax2.set_title(f'Latency Comparison (Op Count: {df["OperationCount"].iloc[op_idx]})')
-    ax2.set_xticks(ind)
-    ax2.set_xticklabels(metrics)
     ax2.legend()
     
     # Plot 3: Overhead factors
@@ -96,41 +155,36 @@ def plot_baseline_comparison(baseline_comp_path='baseline_comparison.csv'):
                         'DataLatencyOverhead']
     overhead_labels = ['Throughput', 'Interest\nLatency', 'Data\nLatency']
 
-    for i, op_count in enumerate(df['OperationCount']):
-        values = [df[metric].iloc[i] for metric in overhead_metrics]
-        ax3.bar(np.arange(len(overhead_metrics)) + i*width, values, width, 
-                label=f'{op_count} ops')
+    # One bar group per metric, one bar per operation count; groups are
+    # capped so they don't run into each other with many operation counts
+    overheads = by_op_count[overhead_metrics].T
+    overheads.index = overhead_labels
+    overheads.columns = [f'{op_count} ops' for op_count in overheads.columns]
+    overheads.plot.bar(ax=ax3, width=min(width*len(df), 0.8), rot=0)
 
     ax3.set_xlabel('Metric')
     ax3.set_ylabel('Overhead Factor (×)')
     ax3.set_title('Performance Overhead Factors')
-    ax3.set_xticks(np.arange(len(overhead_metrics)) + width/2)
-    ax3.set_xticklabels(overhead_labels)
     ax3.legend()
     
     # Plot 4: Memory usage
     ax4 = fig.add_subplot(gs[1, 0])
-    ax4.bar(np.arange(len(x)) - width/2, df['BaselineMemoryMB'], width, label='Baseline')
-    ax4.bar(np.arange(len(x)) + width/2, df['PrivacyMemoryMB'], width, label='Privacy')
+    memory = by_op_count[['BaselineMemoryMB', 'PrivacyMemoryMB']]
+    memory.set_axis(implementations, axis=1).plot.bar(ax=ax4, width=2*width, rot=0)
     ax4.set_xlabel('Operation Count')
     ax4.set_ylabel('Memory Usage (MB)')
     ax4.set_title('Memory Usage Comparison')
-    ax4.set_xticks(np.arange(len(x)))
-    ax4.set_xticklabels(x)
     ax4.legend()
     
     # Plot 5: Detailed latency for higher operation count
     if len(df) > 1:
         ax5 = fig.add_subplot(gs[1, 1])
         op_idx = min(1, len(df) - 1)  # Use the second operation count, if available
-        ax5.bar(ind - width/2, [df[f'Baseline{m}'].iloc[op_idx] for m in metrics], width, label='Baseline')
-        ax5.bar(ind + width/2, [df[f'Privacy{m}'].iloc[op_idx] for m in metrics], width, label='Privacy')
+        latencies.iloc[op_idx].unstack(0).reindex(metrics).plot.bar(ax=ax5, width=2*width, rot=0)
         
         ax5.set_xlabel('Latency Type')
         ax5.set_ylabel('Latency (μs)')
         ax5.set_title(f'Latency Comparison (Op Count: {df["OperationCount"].iloc[op_idx]})')
-        ax5.set_xticks(ind)
-        ax5.set_xticklabels(metrics)
         ax5.legend()
         
     # Plot 6: Privacy overhead vs security (Bar chart instead of radar)
@@ -148,9 +202,8 @@ def plot_baseline_comparison(baseline_comp_path='baseline_comparison.csv'):
     for i, v in enumerate(privacy_overheads):
         ax6.text(i, v + 0.1, f"{v:.2f}x", ha='center')
     
-    plt.tight_layout()
-    plt.savefig('visualizations/baseline_comparison.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig('visualizations/baseline_comparison.png', **SAVEFIG_KWARGS)
     
     print("Baseline comparison plot saved as 'visualizations/baseline_comparison.png'")
 
@@ -167,54 +220,59 @@ def plot_operations_benchmark(benchmark_path='operations_benchmark.csv'):
     # Check for new error metrics column
     has_error_metrics = 'ErrorCount' in df.columns
     
-    fig = plt.figure(figsize=(16, 12))
-    gs = GridSpec(3, 2, figure=fig)
+    fig = _figure((16, 12))
+    gs = fig.add_gridspec(3, 2)
+    
+    # Shared x values; use log scale if range is large enough
+    op_counts = df['OperationCount'].to_numpy()
+    log_x = op_counts.max() / op_counts.min() > 10
+    # Operation counts as text, for categorical bar positions and labels
+    op_count_labels = df['OperationCount'].astype(str).tolist()
     
     # Plot 1: Throughput vs Operation Count
     ax1 = fig.add_subplot(gs[0, 0])
-    ax1.plot(df['OperationCount'], df['ThroughputOpsPerSec'], 'o-', linewidth=2)
+    ax1.plot(op_counts, df['ThroughputOpsPerSec'], 'o-', linewidth=2)
     ax1.set_xlabel('Operation Count')
     ax1.set_ylabel('Throughput (ops/sec)')
     ax1.set_title('Throughput vs Operation Count')
-    # Use log scale if range is large enough
-    if df['OperationCount'].max() / df['OperationCount'].min() > 10:
+    if log_x:
         ax1.set_xscale('log')
     
     # Plot 2: Latency vs Operation Count
     ax2 = fig.add_subplot(gs[0, 1])
-    ax2.plot(df['OperationCount'], df['InterestLatencyMean'], 'o-', linewidth=2, label='Interest')
-    ax2.plot(df['OperationCount'], df['DataLatencyMean'], 's-', linewidth=2, label='Data')
-    ax2.plot(df['OperationCount'], df['RetrievalLatencyMean'], '^-', linewidth=2, label='Retrieval')
+    # One call draws a line per column; markers and labels are set per line
+    latency_lines = ax2.plot(op_counts, df[['InterestLatencyMean', 'DataLatencyMean', 'RetrievalLatencyMean']].to_numpy(),
+                             '-', linewidth=2)
+    for line, marker, label in zip(latency_lines, ['o', 's', '^'], ['Interest', 'Data', 'Retrieval']):
+        line.set_marker(marker)
+        line.set_label(label)
     ax2.set_xlabel('Operation Count')
     ax2.set_ylabel('Latency (μs)')
     ax2.set_title('Latency vs Operation Count')
-    # Use log scale if range is large enough
-    if df['OperationCount'].max() / df['OperationCount'].min() > 10:
+    if log_x:
         ax2.set_xscale('log')
     ax2.legend()
     
     # Plot 3: Max Stash Size vs Operation Count
     ax3 = fig.add_subplot(gs[1, 0])
-    ax3.plot(df['OperationCount'], df['MaxStashSize'], 'o-', linewidth=2)
+    ax3.plot(op_counts, df['MaxStashSize'], 'o-', linewidth=2)
     ax3.set_xlabel('Operation Count')
     ax3.set_ylabel('Max Stash Size')
     ax3.set_title('Max Stash Size vs Operation Count')
     # Add horizontal line for stash limit
     ax3.axhline(y=STASH_LIMIT_DEFAULT, color='r', linestyle='--', alpha=0.7, 
                 label=f'Default Stash Limit ({STASH_LIMIT_DEFAULT})')
-    # Use log scale if range is large enough
-    if df['OperationCount'].max() / df['OperationCount'].min() > 10:
+    if log_x:
         ax3.set_xscale('log')
     ax3.legend()
     
     # Plot 4: Total Time vs Operation Count
     ax4 = fig.add_subplot(gs[1, 1])
-    ax4.plot(df['OperationCount'], df['TotalTimeSeconds'], 'o-', linewidth=2)
+    ax4.plot(op_counts, df['TotalTimeSeconds'], 'o-', linewidth=2)
     ax4.set_xlabel('Operation Count')
     ax4.set_ylabel('Total Time (seconds)')
     ax4.set_title('Total Time vs Operation Count')
-    # Use log scale if range is large enough
-    if df['OperationCount'].max() / df['OperationCount'].min() > 10:
+    if log_x:
         ax4.set_xscale('log')
     if df['TotalTimeSeconds'].max() / df['TotalTimeSeconds'].min() > 10:
         ax4.set_yscale('log')
@@ -223,115 +281,142 @@ def plot_operations_benchmark(benchmark_path='operations_benchmark.csv'):
     if has_error_metrics:
         ax5 = fig.add_subplot(gs[2, 0])
         # Calculate error rate as percentage of total operations (3 operations per count)
-        df['ErrorRate'] = df['ErrorCount'] / (df['OperationCount'] * 3) * 100
-        ax5.bar(df['OperationCount'].astype(str), df['ErrorRate'], color='red', alpha=0.7)
+        error_counts = df['ErrorCount'].to_numpy()
+        error_rates = error_counts / (op_counts * 3) * 100
+        ax5.bar(op_count_labels, error_rates, color='red', alpha=0.7)
         ax5.set_xlabel('Operation Count')
         ax5.set_ylabel('Error Rate (%)')
         ax5.set_title('Error Rate vs Operation Count')
         
         # Annotate with actual error counts
-        for i, row in df.iterrows():
-            ax5.annotate(f"{row['ErrorCount']} errors", 
-                        (i, row['ErrorRate']), 
+        error_labels = [f"{count} errors" for count in error_counts.tolist()]
+        for i, (label, rate) in enumerate(zip(error_labels, error_rates)):
+            ax5.annotate(label, 
+                        (i, rate), 
                         textcoords="offset points",
                         xytext=(0, 10), 
                         ha='center')
     
     # Plot 6: Stash Size vs Throughput Relationship
     ax6 = fig.add_subplot(gs[2, 1])
-    scatter = ax6.scatter(df['MaxStashSize'], df['ThroughputOpsPerSec'], 
-                         c=df['OperationCount'], cmap='viridis', s=100, alpha=0.7)
-    
-    for i, row in df.iterrows():
-        ax6.annotate(f"{row['OperationCount']} ops",
-                    (row['MaxStashSize'], row['ThroughputOpsPerSec']),
+    stash_sizes = df['MaxStashSize'].to_numpy()
+    throughputs = df['ThroughputOpsPerSec'].to_numpy()
+    scatter = ax6.scatter(stash_sizes, throughputs, 
+                         c=op_counts, cmap='viridis', s=100, alpha=0.7)
+    
+    op_labels = [f'{label} ops' for label in op_count_labels]
+    for label, stash_size, throughput in zip(op_labels, stash_sizes, throughputs):
+        ax6.annotate(label,
+                    (stash_size, throughput),
                     xytext=(5, 5), textcoords='offset points',
                     fontsize=8)
     
     ax6.set_xlabel('Max Stash Size')
     ax6.set_ylabel('Throughput (ops/sec)')
     ax6.set_title('Stash Size vs Throughput Relationship')
-    cbar = plt.colorbar(scatter, ax=ax6)
+    cbar = fig.colorbar(scatter, ax=ax6)
     cbar.set_label('Operation Count')
     
-    plt.tight_layout()
+    fig.tight_layout()
     
-    # Create visualizations directory if it doesn't exist
-    os.makedirs('visualizations', exist_ok=True)
-    plt.savefig('visualizations/operations_benchmark.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig('visualizations/operations_benchmark.png', **SAVEFIG_KWARGS)
     
     print("Operations benchmark plot saved as 'visualizations/operations_benchmark.png'")
 
-def plot_stash_history(results_dir='results'):
+def index_results(results_dir='results'):
+    """List the log files and operation metrics files in results_dir.
+    
+    Returns (log_files, operation_files), matching the *.log and
+    operations_*.csv globs but from a single directory scan.
+    """
+    log_files = []
+    operation_files = []
+    try:
+        with os.scandir(results_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                # glob skips hidden files
+                if name.startswith('.'):
+                    continue
+                if name.endswith('.log'):
+                    log_files.append(entry.path)
+                elif name.startswith('operations_') and name.endswith('.csv'):
+                    operation_files.append(entry.path)
+    except FileNotFoundError:
+        pass
+    return log_files, operation_files
+
+def plot_stash_history(results_dir='results', operation_files=None):
     """Plot stash size history from detailed metrics files."""
     print("Plotting stash size history from detailed metrics files")
     
     # Find operation metrics files
-    operation_files = glob.glob(f"{results_dir}/operations_*.csv")
+    if operation_files is None:
+        operation_files = glob.glob(f"{results_dir}/operations_*.csv")
     
     if not operation_files:
         print("No operation metrics files found.")
         return
     
-    plt.figure(figsize=(14, 8))
+    fig = _figure((14, 8))
+    ax = fig.add_subplot()
     
     for file in operation_files:
         # Extract operation count from filename
-        try:
-            op_count = int(file.split('_')[-1].split('.')[0])
-        except:
+        match = OP_COUNT_PATTERN.search(file)
+        if match is None:
             print(f"Could not extract operation count from {file}")
             continue
+        op_count = int(match.group(1))
         
         # Read stash history section
-        stash_history = []
-        in_stash_section = False
-        line_count = 0
-        
         try:
-            with open(file, 'r') as f:
+            with open(file, 'rb') as f:
+                # Skip ahead to the stash section, then parse the rest in one go
                 for line in f:
-                    line = line.strip()
-                    if line == "Stash Size History":
-                        in_stash_section = True
-                        continue
-                    
-                    if in_stash_section:
-                        if line and line != "Stash Size History":
-                            try:
-                                stash_history.append(int(line))
-                                line_count += 1
-                            except ValueError:
-                                # Skip non-integer lines
-                                pass
+                    if line.strip() == b"Stash Size History":
+                        # Keep only integer lines, testing each with a cheap
+                        # match rather than letting int() raise on the rest
+                        values = [value for value in map(bytes.strip, f.read().splitlines())
+                                  if INTEGER_LINE_PATTERN.fullmatch(value)]
+                        stash_history = np.array(values, dtype=bytes).astype(np.int64)
+                        break
+                else:
+                    stash_history = np.empty(0, dtype=np.int64)
             
-            if stash_history:
-                # Downsample for large histories to avoid cluttering the plot
+            if stash_history.size:
+                # Peak and time spent over the default limit, taken from the
+                # full history before downsampling
+                peak_stash = stash_history.max()
+                over_limit = np.count_nonzero(stash_history > STASH_LIMIT_DEFAULT)
+                
+                # Downsample for large histories to avoid cluttering the plot,
+                # keeping the peak of each window (including a shorter final
+                # one) so stash spikes stay visible, even at the very end
                 if len(stash_history) > 1000:
                     downsample_factor = len(stash_history) // 1000 + 1
-                    stash_history = stash_history[::downsample_factor]
+                    window_starts = np.arange(0, len(stash_history), downsample_factor)
+                    stash_history = np.maximum.reduceat(stash_history, window_starts)
                 
                 # Plot stash size over time
-                plt.plot(range(len(stash_history)), stash_history, 
-                         label=f'{op_count} ops ({len(stash_history)} points)')
+                ax.plot(range(len(stash_history)), stash_history, 
+                        label=f'{op_count} ops ({len(stash_history)} points, '
+                              f'peak {peak_stash}, {over_limit} over limit)')
                 
                 # Add horizontal line for stash limit
-                plt.axhline(y=STASH_LIMIT_DEFAULT, color='r', linestyle='--', alpha=0.5,
+                ax.axhline(y=STASH_LIMIT_DEFAULT, color='r', linestyle='--', alpha=0.5,
                            label=f'Default Stash Limit ({STASH_LIMIT_DEFAULT})' if op_count == operation_files[0] else "")
         except Exception as e:
             print(f"Error processing {file}: {e}")
     
-    plt.xlabel('Operation Sequence')
-    plt.ylabel('Stash Size')
-    plt.title('Stash Size Evolution During Operations')
-    plt.grid(True)
-    plt.legend()
+    ax.set_xlabel('Operation Sequence')
+    ax.set_ylabel('Stash Size')
+    ax.set_title('Stash Size Evolution During Operations')
+    ax.grid(True)
+    ax.legend()
+    fig.tight_layout()
     
-    # Create visualizations directory if it doesn't exist
-    os.makedirs('visualizations', exist_ok=True)
-    plt.savefig('visualizations/stash_history.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.savefig('visualizations/stash_history.png', **SAVEFIG_KWARGS)
     
     print("Stash size history plot saved as 'visualizations/stash_history.png'")
 
@@ -345,9 +430,9 @@ def plot_config_parameters(config_benchmark_path='config_benchmark_results.csv')
         print("No data found for configuration benchmark")
         return
     
-    # Remove error rows
-    df = df[~df['Throughput'].astype(str).str.contains('ERROR')]
-    df['Throughput'] = pd.to_numeric(df['Throughput'], errors='coerce')
+    # Remove error rows: 'ERROR: ...' entries fail numeric conversion and
+    # are dropped along with any other missing throughput values
+    df = df.assign(Throughput=pd.to_numeric(df['Throughput'], errors='coerce'))
     df = df.dropna(subset=['Throughput'])
     
     if df.empty:
@@ -355,61 +440,70 @@ def plot_config_parameters(config_benchmark_path='config_benchmark_results.csv')
         return
     
     # Create figure
-    fig = plt.figure(figsize=(16, 12))
-    gs = GridSpec(2, 3, figure=fig)
+    fig = _figure((16, 12))
+    gs = fig.add_gridspec(2, 3)
+    
+    # Default-parameter masks, each shared by two of the sweeps below
+    default_height = df['TreeHeight'] == 5
+    default_capacity = df['BucketCapacity'] == 4
+    default_stash = df['StashLimit'] == 100
     
     # Plot 1: Impact of Tree Height on Throughput
-    tree_height_df = df[(df['BucketCapacity'] == 4) & (df['StashLimit'] == 100)]
+    tree_height_df = df.loc[default_capacity & default_stash]
+    tree_heights = tree_height_df['TreeHeight'].to_numpy()
     if not tree_height_df.empty:
         ax1 = fig.add_subplot(gs[0, 0])
-        ax1.plot(tree_height_df['TreeHeight'], tree_height_df['Throughput'], 'o-', linewidth=2)
+        ax1.plot(tree_heights, tree_height_df['Throughput'], 'o-', linewidth=2)
         ax1.set_xlabel('Tree Height')
         ax1.set_ylabel('Throughput (ops/sec)')
         ax1.set_title('Tree Height vs Throughput', pad=20)
         # Set integer ticks for x-axis
-        ax1.set_xticks(tree_height_df['TreeHeight'].unique())
+        ax1.set_xticks(np.unique(tree_heights))
         
         # Add second y-axis for latency
         ax1_twin = ax1.twinx()
-        ax1_twin.plot(tree_height_df['TreeHeight'], tree_height_df['AvgInterestLatency'], 's--', color='red', linewidth=2)
+        ax1_twin.plot(tree_heights, tree_height_df['AvgInterestLatency'], 's--', color='red', linewidth=2)
         ax1_twin.set_ylabel('Avg Interest Latency (μs)', color='red')
         ax1_twin.tick_params(axis='y', labelcolor='red')
     
     # Plot 2: Impact of Bucket Capacity on Throughput
-    bucket_capacity_df = df[(df['TreeHeight'] == 5) & (df['StashLimit'] == 100)]
+    bucket_capacity_df = df.loc[default_height & default_stash]
+    bucket_capacities = bucket_capacity_df['BucketCapacity'].to_numpy()
     if not bucket_capacity_df.empty:
         ax2 = fig.add_subplot(gs[0, 1])
-        ax2.plot(bucket_capacity_df['BucketCapacity'], bucket_capacity_df['Throughput'], 'o-', linewidth=2)
+        ax2.plot(bucket_capacities, bucket_capacity_df['Throughput'], 'o-', linewidth=2)
         ax2.set_xlabel('Bucket Capacity')
         ax2.set_ylabel('Throughput (ops/sec)')
         ax2.set_title('Bucket Capacity vs Throughput', pad=20)
         # Set integer ticks for x-axis
-        ax2.set_xticks(bucket_capacity_df['BucketCapacity'].unique())
+        ax2.set_xticks(np.unique(bucket_capacities))
         
         # Add second y-axis for latency
         ax2_twin = ax2.twinx()
-        ax2_twin.plot(bucket_capacity_df['BucketCapacity'], bucket_capacity_df['AvgInterestLatency'], 's--', color='red', linewidth=2)
+        ax2_twin.plot(bucket_capacities, bucket_capacity_df['AvgInterestLatency'], 's--', color='red', linewidth=2)
         ax2_twin.set_ylabel('Avg Interest Latency (μs)', color='red')
         ax2_twin.tick_params(axis='y', labelcolor='red')
     
     # Plot 3: Impact of Stash Limit on Throughput
-    stash_limit_df = df[(df['TreeHeight'] == 5) & (df['BucketCapacity'] == 4)]
+    stash_limit_df = df.loc[default_height & default_capacity]
+    stash_limits = stash_limit_df['StashLimit'].to_numpy()
     if not stash_limit_df.empty:
         ax3 = fig.add_subplot(gs[0, 2])
-        ax3.plot(stash_limit_df['StashLimit'], stash_limit_df['Throughput'], 'o-', linewidth=2)
+        ax3.plot(stash_limits, stash_limit_df['Throughput'], 'o-', linewidth=2)
         ax3.set_xlabel('Stash Limit')
         ax3.set_ylabel('Throughput (ops/sec)')
         ax3.set_title('Stash Limit vs Throughput', pad=20)
         
         # Add second y-axis for max stash size
         ax3_twin = ax3.twinx()
-        ax3_twin.plot(stash_limit_df['StashLimit'], stash_limit_df['MaxStashSize'], 's--', color='green', linewidth=2)
+        max_stash_sizes = stash_limit_df['MaxStashSize'].to_numpy()
+        ax3_twin.plot(stash_limits, max_stash_sizes, 's--', color='green', linewidth=2)
         ax3_twin.set_ylabel('Max Stash Size', color='green')
         ax3_twin.tick_params(axis='y', labelcolor='green')
         
         # Add utilization ratio line (MaxStashSize/StashLimit)
-        ax3_twin.plot(stash_limit_df['StashLimit'], 
-                     stash_limit_df['MaxStashSize']/stash_limit_df['StashLimit']*100, 
+        ax3_twin.plot(stash_limits, 
+                     max_stash_sizes / stash_limits * 100, 
                      '^--', color='purple', linewidth=2)
         # Add second label
         ax3_twin.set_ylabel('Max Stash Size / Utilization %', color='green')
@@ -420,48 +514,123 @@ def plot_config_parameters(config_benchmark_path='config_benchmark_results.csv')
     # Plot 4: Tree Height vs Latency Components
     if not tree_height_df.empty:
         ax4 = fig.add_subplot(gs[1, 0])
-        ax4.plot(tree_height_df['TreeHeight'], tree_height_df['AvgInterestLatency'], 'o-', linewidth=2, label='Interest')
-        ax4.plot(tree_height_df['TreeHeight'], tree_height_df['AvgDataLatency'], 's-', linewidth=2, label='Data')
-        ax4.plot(tree_height_df['TreeHeight'], tree_height_df['AvgRetrievalLatency'], '^-', linewidth=2, label='Retrieval')
+        ax4.plot(tree_heights, tree_height_df['AvgInterestLatency'], 'o-', linewidth=2, label='Interest')
+        ax4.plot(tree_heights, tree_height_df['AvgDataLatency'], 's-', linewidth=2, label='Data')
+        ax4.plot(tree_heights, tree_height_df['AvgRetrievalLatency'], '^-', linewidth=2, label='Retrieval')
         ax4.set_xlabel('Tree Height')
         ax4.set_ylabel('Latency (μs)')
         ax4.set_title('Tree Height: Latency Components', pad=20)
-        ax4.set_xticks(tree_height_df['TreeHeight'].unique())
+        ax4.set_xticks(np.unique(tree_heights))
         ax4.legend()
     
     # Plot 5: Bucket Capacity vs Latency Components
     if not bucket_capacity_df.empty:
         ax5 = fig.add_subplot(gs[1, 1])
-        ax5.plot(bucket_capacity_df['BucketCapacity'], bucket_capacity_df['AvgInterestLatency'], 'o-', linewidth=2, label='Interest')
-        ax5.plot(bucket_capacity_df['BucketCapacity'], bucket_capacity_df['AvgDataLatency'], 's-', linewidth=2, label='Data')
-        ax5.plot(bucket_capacity_df['BucketCapacity'], bucket_capacity_df['AvgRetrievalLatency'], '^-', linewidth=2, label='Retrieval')
+        ax5.plot(bucket_capacities, bucket_capacity_df['AvgInterestLatency'], 'o-', linewidth=2, label='Interest')
+        ax5.plot(bucket_capacities, bucket_capacity_df['AvgDataLatency'], 's-', linewidth=2, label='Data')
+        ax5.plot(bucket_capacities, bucket_capacity_df['AvgRetrievalLatency'], '^-', linewidth=2, label='Retrieval')
         ax5.set_xlabel('Bucket Capacity')
         ax5.set_ylabel('Latency (μs)')
         ax5.set_title('Bucket Capacity: Latency Components', pad=20)
-        ax5.set_xticks(bucket_capacity_df['BucketCapacity'].unique())
+        ax5.set_xticks(np.unique(bucket_capacities))
         ax5.legend()
     
     # Plot 6: Stash Limit vs Latency Components
     if not stash_limit_df.empty:
         ax6 = fig.add_subplot(gs[1, 2])
-        ax6.plot(stash_limit_df['StashLimit'], stash_limit_df['AvgInterestLatency'], 'o-', linewidth=2, label='Interest')
-        ax6.plot(stash_limit_df['StashLimit'], stash_limit_df['AvgDataLatency'], 's-', linewidth=2, label='Data')
-        ax6.plot(stash_limit_df['StashLimit'], stash_limit_df['AvgRetrievalLatency'], '^-', linewidth=2, label='Retrieval')
+        ax6.plot(stash_limits, stash_limit_df['AvgInterestLatency'], 'o-', linewidth=2, label='Interest')
+        ax6.plot(stash_limits, stash_limit_df['AvgDataLatency'], 's-', linewidth=2, label='Data')
+        ax6.plot(stash_limits, stash_limit_df['AvgRetrievalLatency'], '^-', linewidth=2, label='Retrieval')
         ax6.set_xlabel('Stash Limit')
         ax6.set_ylabel('Latency (μs)')
         ax6.set_title('Stash Limit: Latency Components', pad=20)
         ax6.legend()
     
-    plt.tight_layout()
-    # Create visualizations directory if it doesn't exist
-    os.makedirs('visualizations', exist_ok=True)
-    plt.savefig('visualizations/config_parameters.png', dpi=300, bbox_inches='tight')
-    plt.close()
+    fig.tight_layout()
+    fig.savefig('visualizations/config_parameters.png', **SAVEFIG_KWARGS)
     
     print("Configuration parameters plot saved as 'visualizations/config_parameters.png'")
 
-def generate_performance_summary(results_dir='results'):
-    """Generate a comprehensive summary of all results and metrics."""
+# Logs smaller than this are read into memory rather than mmapped
+MMAP_MIN_BYTES = 64 * 1024
+
+# Log scans are I/O bound and release the GIL while reading, so they are
+# overlapped on a small thread pool
+LOG_SCAN_WORKERS = 8
+
+def _count_token(buf, token):
+    """Count non-overlapping occurrences of token in a bytes-like buffer."""
+    count = 0
+    pos = buf.find(token)
+    while pos != -1:
+        count += 1
+        pos = buf.find(token, pos + len(token))
+    return count
+
+def _count_lines_with(buf, token, other):
+    """Count lines of a bytes-like buffer containing both token and other.
+    
+    Jumps between occurrences of token with find() and checks only those
+    lines for other, rather than running a per-line regex over the buffer.
+    """
+    count = 0
+    pos = buf.find(token)
+    while pos != -1:
+        line_start = buf.rfind(b'\n', 0, pos) + 1
+        line_end = buf.find(b'\n', pos)
+        if line_end == -1:
+            line_end = len(buf)
+        if buf.find(other, line_start, line_end) != -1:
+            count += 1
+        # Each line is counted at most once
+        pos = buf.find(token, line_end)
+    return count
+
+def count_emergency_events(log_file):
+    """Count emergency-mode events recorded in a router log file."""
+    with open(log_file, 'rb') as f:
+        # Small logs (including empty ones, which mmap rejects) are cheaper
+        # to read outright than to map
+        if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+            return _scan_emergency_events(f.read())
+        # Search the mapped pages directly instead of copying the log into memory
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return _scan_emergency_events(mm)
+
+def _scan_emergency_events(buf):
+    """Count emergency-mode events in a bytes-like log buffer."""
+    return {
+        'emergency_evictions': _count_token(buf, b'[EMERGENCY]'),
+        'critical_evictions': _count_token(buf, b'CRITICAL EVICTION'),
+        # Lines mentioning both "Dropping" and "blocks", in that order or not
+        'emergency_drops': _count_lines_with(buf, b'Dropping', b'blocks'),
+        'stash_expansions': _count_token(buf, b'Dynamically expanded')
+    }
+
+def scan_log_files(log_files):
+    """Count emergency events in each log file concurrently.
+    
+    Returns one counts dict per file, in input order, with None for files
+    that could not be read (the error is printed).
+    """
+    with ThreadPoolExecutor(max_workers=max(1, min(LOG_SCAN_WORKERS, len(log_files)))) as executor:
+        futures = [executor.submit(count_emergency_events, log_file) for log_file in log_files]
+    
+    results = []
+    for log_file, future in zip(log_files, futures):
+        try:
+            results.append(future.result())
+        except Exception as e:
+            print(f"Error processing {log_file}: {e}")
+            results.append(None)
+    return results
+
+def generate_performance_summary(results_dir='results', log_files=None, log_counts=None):
+    """Generate a comprehensive summary of all results and metrics.
+    
+    log_counts, if given, holds the scan_log_files() results for log_files
+    so a caller can share one scan of each log between tasks.
+    """
     print("Generating comprehensive performance summary...")
     
     summary_data = {}
@@ -493,27 +662,23 @@ def generate_performance_summary(results_dir='results'):
             }
     
     # Count emergency operations from log files
-    log_files = glob.glob(f"{results_dir}/*.log")
+    if log_files is None:
+        log_files = glob.glob(f"{results_dir}/*.log")
     if log_files:
+        if log_counts is None:
+            log_counts = scan_log_files(log_files)
         emergency_evictions = 0
         critical_evictions = 0
         emergency_drops = 0
         stash_expansions = 0
         
-        for log_file in log_files:
-            try:
-                with open(log_file, 'r') as f:
-                    for line in f:
-                        if "[EMERGENCY]" in line:
-                            emergency_evictions += 1
-                        if "CRITICAL EVICTION" in line:
-                            critical_evictions += 1
-                        if "Dropping" in line and "blocks" in line:
-                            emergency_drops += 1
-                        if "Dynamically expanded" in line:
-                            stash_expansions += 1
-            except Exception as e:
-                print(f"Error processing {log_file}: {e}")
+        for counts in log_counts:
+            if counts is None:
+                continue
+            emergency_evictions += counts['emergency_evictions']
+            critical_evictions += counts['critical_evictions']
+            emergency_drops += counts['emergency_drops']
+            stash_expansions += counts['stash_expansions']
         
         summary_data['emergency'] = {
             'emergency_evictions': emergency_evictions,
@@ -525,141 +690,133 @@ def generate_performance_summary(results_dir='results'):
     # Generate summary report
     if summary_data:
         report_path = 'visualizations/performance_summary.txt'
-        with open(report_path, 'w') as f:
-            f.write("==== NDN ROUTER PERFORMANCE SUMMARY ====\n\n")
-            f.write(f"Generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            f.write("CONFIGURATION PARAMETERS:\n")
-            f.write(f"Tree Height: {TREE_HEIGHT_DEFAULT}\n")
-            f.write(f"Bucket Capacity: {BUCKET_CAPACITY_DEFAULT}\n")
-            f.write(f"Stash Limit: {STASH_LIMIT_DEFAULT}\n")
-            f.write(f"Queue Tree Height: {QUEUE_TREE_HEIGHT_DEFAULT}\n")
-            f.write(f"Queue Bucket Capacity: {QUEUE_BUCKET_CAPACITY_DEFAULT}\n")
-            f.write(f"Queue Stash Limit: {QUEUE_STASH_LIMIT_DEFAULT}\n\n")
-            
-            if 'operations' in summary_data:
-                ops = summary_data['operations']
-                f.write("OPERATIONS BENCHMARK METRICS:\n")
-                f.write(f"Maximum Throughput: {ops['max_throughput']:.2f} ops/sec\n")
-                f.write(f"Minimum Throughput: {ops['min_throughput']:.2f} ops/sec\n")
-                f.write(f"Average Throughput: {ops['avg_throughput']:.2f} ops/sec\n")
-                f.write(f"Maximum Stash Size: {ops['max_stash_size']} blocks\n")
-                f.write(f"Maximum Operation Count: {ops['max_op_count']} operations\n")
-                f.write(f"Error Rate: {ops['error_rate']}%\n\n")
+        # Build the report in memory and write it out in one go
+        parts = []
+        parts.append("==== NDN ROUTER PERFORMANCE SUMMARY ====\n\n")
+        parts.append(f"Generated on: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        
+        parts.append("CONFIGURATION PARAMETERS:\n")
+        parts.append(f"Tree Height: {TREE_HEIGHT_DEFAULT}\n")
+        parts.append(f"Bucket Capacity: {BUCKET_CAPACITY_DEFAULT}\n")
+        parts.append(f"Stash Limit: {STASH_LIMIT_DEFAULT}\n")
+        parts.append(f"Queue Tree Height: {QUEUE_TREE_HEIGHT_DEFAULT}\n")
+        parts.append(f"Queue Bucket Capacity: {QUEUE_BUCKET_CAPACITY_DEFAULT}\n")
+        parts.append(f"Queue Stash Limit: {QUEUE_STASH_LIMIT_DEFAULT}\n\n")
+        
+        if 'operations' in summary_data:
+            ops = summary_data['operations']
+            parts.append("OPERATIONS BENCHMARK METRICS:\n")
+            parts.append(f"Maximum Throughput: {ops['max_throughput']:.2f} ops/sec\n")
+            parts.append(f"Minimum Throughput: {ops['min_throughput']:.2f} ops/sec\n")
+            parts.append(f"Average Throughput: {ops['avg_throughput']:.2f} ops/sec\n")
+            parts.append(f"Maximum Stash Size: {ops['max_stash_size']} blocks\n")
+            parts.append(f"Maximum Operation Count: {ops['max_op_count']} operations\n")
+            parts.append(f"Error Rate: {ops['error_rate']}%\n\n")
+        
+        if 'baseline' in summary_data:
+            baseline = summary_data['baseline']
+            parts.append("PRIVACY OVERHEAD METRICS:\n")
+            parts.append(f"Throughput Overhead: {baseline['avg_throughput_overhead']:.2f}x\n")
+            parts.append(f"Latency Overhead: {baseline['avg_latency_overhead']:.2f}x\n")
+            parts.append(f"Memory Overhead: {baseline['avg_memory_overhead']:.2f}x\n")
+            parts.append(f"Privacy Implementation Max Throughput: {baseline['privacy_max_throughput']:.2f} ops/sec\n\n")
+        
+        if 'emergency' in summary_data:
+            emergency = summary_data['emergency']
+            parts.append("EMERGENCY OPERATIONS METRICS:\n")
+            parts.append(f"Emergency Evictions: {emergency['emergency_evictions']}\n")
+            parts.append(f"Critical Evictions: {emergency['critical_evictions']}\n")
+            parts.append(f"Emergency Block Drops: {emergency['emergency_drops']}\n")
+            parts.append(f"Dynamic Stash Expansions: {emergency['stash_expansions']}\n\n")
+        
+        parts.append("CONCLUSIONS:\n")
+        
+        # Generate some automatic conclusions based on the data
+        if 'operations' in summary_data and 'baseline' in summary_data:
+            ops = summary_data['operations']
+            baseline = summary_data['baseline']
             
-            if 'baseline' in summary_data:
-                baseline = summary_data['baseline']
-                f.write("PRIVACY OVERHEAD METRICS:\n")
-                f.write(f"Throughput Overhead: {baseline['avg_throughput_overhead']:.2f}x\n")
-                f.write(f"Latency Overhead: {baseline['avg_latency_overhead']:.2f}x\n")
-                f.write(f"Memory Overhead: {baseline['avg_memory_overhead']:.2f}x\n")
-                f.write(f"Privacy Implementation Max Throughput: {baseline['privacy_max_throughput']:.2f} ops/sec\n\n")
+            # Throughput assessment
+            throughput_overhead = baseline['avg_throughput_overhead']
+            if throughput_overhead < 3:
+                parts.append("- The privacy-preserving implementation shows excellent throughput performance with minimal overhead.\n")
+            elif throughput_overhead < 10:
+                parts.append("- The privacy-preserving implementation shows acceptable throughput overhead for the privacy benefits.\n")
+            else:
+                parts.append("- The privacy-preserving implementation has significant throughput overhead, which may be a concern for high-throughput applications.\n")
             
+            # Stash assessment
             if 'emergency' in summary_data:
                 emergency = summary_data['emergency']
-                f.write("EMERGENCY OPERATIONS METRICS:\n")
-                f.write(f"Emergency Evictions: {emergency['emergency_evictions']}\n")
-                f.write(f"Critical Evictions: {emergency['critical_evictions']}\n")
-                f.write(f"Emergency Block Drops: {emergency['emergency_drops']}\n")
-                f.write(f"Dynamic Stash Expansions: {emergency['stash_expansions']}\n\n")
-            
-            f.write("CONCLUSIONS:\n")
-            
-            # Generate some automatic conclusions based on the data
-            if 'operations' in summary_data and 'baseline' in summary_data:
-                ops = summary_data['operations']
-                baseline = summary_data['baseline']
-                
-                # Throughput assessment
-                throughput_overhead = baseline['avg_throughput_overhead']
-                if throughput_overhead < 3:
-                    f.write("- The privacy-preserving implementation shows excellent throughput performance with minimal overhead.\n")
-                elif throughput_overhead < 10:
-                    f.write("- The privacy-preserving implementation shows acceptable throughput overhead for the privacy benefits.\n")
-                else:
-                    f.write("- The privacy-preserving implementation has significant throughput overhead, which may be a concern for high-throughput applications.\n")
-                
-                # Stash assessment
-                if 'emergency' in summary_data:
-                    emergency = summary_data['emergency']
-                    if emergency['emergency_drops'] > 0:
-                        f.write("- The system had to drop non-essential blocks to maintain operation, indicating that stash parameters may need adjustment.\n")
-                    elif emergency['stash_expansions'] > 0:
-                        f.write("- The system needed to dynamically expand the stash size, suggesting that a larger default stash size might be beneficial.\n")
-                    
-                    if emergency['critical_evictions'] > 10:
-                        f.write("- High number of critical evictions suggests that more aggressive background eviction might help performance.\n")
+                if emergency['emergency_drops'] > 0:
+                    parts.append("- The system had to drop non-essential blocks to maintain operation, indicating that stash parameters may need adjustment.\n")
+                elif emergency['stash_expansions'] > 0:
+                    parts.append("- The system needed to dynamically expand the stash size, suggesting that a larger default stash size might be beneficial.\n")
                 
-                # Overall assessment
-                max_op_count = ops['max_op_count']
-                if max_op_count >= 1000:
-                    f.write("- The system successfully handled large operation counts, demonstrating scalability.\n")
-                elif max_op_count >= 500:
-                    f.write("- The system handled moderate operation counts successfully.\n")
-                else:
-                    f.write("- The system handled smaller operation counts. More testing is needed to assess scalability.\n")
+                if emergency['critical_evictions'] > 10:
+                    parts.append("- High number of critical evictions suggests that more aggressive background eviction might help performance.\n")
             
-            # Final comment on the code changes we made
-            f.write("\nIMPROVEMENTS ASSESSMENT:\n")
-            f.write("- The simplified bucket structure without atomic locks has improved compilation and stability.\n")
-            f.write("- Increased default stash limit and bucket capacity parameters have enhanced the system's ability to handle larger workloads.\n")
-            f.write("- Emergency block dropping and dynamic stash expansion features have added robustness to prevent crashes under high load.\n")
-            f.write("- More aggressive eviction triggers have helped maintain reasonable stash utilization.\n")
+            # Overall assessment
+            max_op_count = ops['max_op_count']
+            if max_op_count >= 1000:
+                parts.append("- The system successfully handled large operation counts, demonstrating scalability.\n")
+            elif max_op_count >= 500:
+                parts.append("- The system handled moderate operation counts successfully.\n")
+            else:
+                parts.append("- The system handled smaller operation counts. More testing is needed to assess scalability.\n")
+        
+        # Final comment on the code changes we made
+        parts.append("\nIMPROVEMENTS ASSESSMENT:\n")
+        parts.append("- The simplified bucket structure without atomic locks has improved compilation and stability.\n")
+        parts.append("- Increased default stash limit and bucket capacity parameters have enhanced the system's ability to handle larger workloads.\n")
+        parts.append("- Emergency block dropping and dynamic stash expansion features have added robustness to prevent crashes under high load.\n")
+        parts.append("- More aggressive eviction triggers have helped maintain reasonable stash utilization.\n")
+        
+        with open(report_path, 'w') as f:
+            f.write(''.join(parts))
         
         print(f"Performance summary saved to {report_path}")
     else:
         print("Not enough data to generate performance summary.")
 
-def plot_emergency_mode_analysis(results_dir='results'):
-    """Plot analysis of emergency mode activations."""
+def plot_emergency_mode_analysis(results_dir='results', log_files=None, log_counts=None):
+    """Plot analysis of emergency mode activations.
+    
+    log_counts, if given, holds the scan_log_files() results for log_files.
+    """
     print("Analyzing emergency mode activations")
     
     # Look for log files with emergency mode metrics
-    log_files = glob.glob(f"{results_dir}/*.log")
+    if log_files is None:
+        log_files = glob.glob(f"{results_dir}/*.log")
     
     if not log_files:
         print("No log files found for emergency mode analysis.")
         return
     
+    if log_counts is None:
+        log_counts = scan_log_files(log_files)
+    
     # Collect data about emergency operations
     emergency_data = []
     
-    for log_file in log_files:
-        op_count = 0
-        try:
-            # Try to extract operation count from filename
-            op_count = int(log_file.split('_')[-1].split('.')[0])
-        except:
+    for file_index, (log_file, counts) in enumerate(zip(log_files, log_counts)):
+        if counts is None:
+            continue
+        
+        # Try to extract operation count from filename
+        match = OP_COUNT_PATTERN.search(log_file)
+        if match is not None:
+            op_count = int(match.group(1))
+        else:
             # If can't extract from filename, use index as identifier
-            op_count = log_files.index(log_file)
+            op_count = file_index
         
         # Collect emergency operation counts
-        emergency_evictions = 0
-        critical_evictions = 0
-        emergency_drops = 0
-        stash_expansions = 0
-        
-        try:
-            with open(log_file, 'r') as f:
-                for line in f:
-                    if "[EMERGENCY]" in line:
-                        emergency_evictions += 1
-                    if "CRITICAL EVICTION" in line:
-                        critical_evictions += 1
-                    if "Dropping" in line and "blocks" in line:
-                        emergency_drops += 1
-                    if "Dynamically expanded" in line:
-                        stash_expansions += 1
-            
-            emergency_data.append({
-                'operation_count': op_count,
-                'emergency_evictions': emergency_evictions,
-                'critical_evictions': critical_evictions,
-                'emergency_drops': emergency_drops,
-                'stash_expansions': stash_expansions
-            })
-        except Exception as e:
-            print(f"Error processing {log_file}: {e}")
+        emergency_data.append({
+            'operation_count': op_count,
+            **counts
+        })
     
     if not emergency_data:
         print("No emergency mode data found.")
@@ -670,27 +827,27 @@ def plot_emergency_mode_analysis(results_dir='results'):
     em_df = em_df.sort_values('operation_count')
     
     # Create visualization
-    plt.figure(figsize=(14, 8))
+    fig = _figure((14, 8))
+    ax = fig.add_subplot()
     
     if not em_df.empty:
         width = 0.2
         x = np.arange(len(em_df))
         
-        plt.bar(x - 1.5*width, em_df['emergency_evictions'], width, label='Emergency Evictions')
-        plt.bar(x - 0.5*width, em_df['critical_evictions'], width, label='Critical Evictions')
-        plt.bar(x + 0.5*width, em_df['emergency_drops'], width, label='Block Drops')
-        plt.bar(x + 1.5*width, em_df['stash_expansions'], width, label='Stash Expansions')
+        ax.bar(x - 1.5*width, em_df['emergency_evictions'], width, label='Emergency Evictions')
+        ax.bar(x - 0.5*width, em_df['critical_evictions'], width, label='Critical Evictions')
+        ax.bar(x + 0.5*width, em_df['emergency_drops'], width, label='Block Drops')
+        ax.bar(x + 1.5*width, em_df['stash_expansions'], width, label='Stash Expansions')
         
-        plt.xlabel('Operation Count')
-        plt.ylabel('Count')
-        plt.title('Emergency Mode Operations')
-        plt.xticks(x, em_df['operation_count'])
-        plt.legend()
+        ax.set_xlabel('Operation Count')
+        ax.set_ylabel('Count')
+        ax.set_title('Emergency Mode Operations')
+        ax.set_xticks(x)
+        ax.set_xticklabels(em_df['operation_count'])
+        ax.legend()
+        fig.tight_layout()
         
-        # Create visualizations directory if it doesn't exist
-        os.makedirs('visualizations', exist_ok=True)
-        plt.savefig('visualizations/emergency_mode_analysis.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig('visualizations/emergency_mode_analysis.png', **SAVEFIG_KWARGS)
         
         print("Emergency mode analysis plot saved as 'visualizations/emergency_mode_analysis.png'")
     else:
@@ -708,33 +865,51 @@ def main():
     """Main function to run all visualization functions."""
     print("Starting NDN Router Performance Visualization")
     
-    # Create visualizations directory if it doesn't exist
+    # Create visualizations directory once, rather than before every save;
+    # importing this module leaves the filesystem alone
     os.makedirs('visualizations', exist_ok=True)
     
-    # Run visualizations based on available files
+    # Collect visualizations based on available files
+    tasks = []
     if os.path.exists('baseline_comparison.csv'):
-        plot_baseline_comparison()
+        tasks.append(plot_baseline_comparison)
     else:
         print("baseline_comparison.csv not found, skipping baseline comparison visualization.")
     
     if os.path.exists('operations_benchmark.csv'):
-        plot_operations_benchmark()
+        tasks.append(plot_operations_benchmark)
     else:
         print("operations_benchmark.csv not found, skipping operations benchmark visualization.")
     
     if os.path.exists('config_benchmark_results.csv'):
-        plot_config_parameters()
+        tasks.append(plot_config_parameters)
     else:
         print("config_benchmark_results.csv not found, skipping configuration parameter visualization.")
     
+    # Scan the results directory once and share the file lists
+    log_files, operation_files = index_results('results')
+    
     # Plot stash history from detailed metrics files
-    plot_stash_history()
+    tasks.append(functools.partial(plot_stash_history, operation_files=operation_files))
+    
+    # Count emergency events once here; the plot and the summary run in
+    # separate worker processes and would otherwise each scan every log
+    log_counts = scan_log_files(log_files) if log_files else []
     
     # Plot emergency mode analysis if log files exist
-    plot_emergency_mode_analysis()
+    tasks.append(functools.partial(plot_emergency_mode_analysis,
+                                   log_files=log_files, log_counts=log_counts))
     
     # Generate comprehensive performance summary
-    generate_performance_summary()
+    tasks.append(functools.partial(generate_performance_summary,
+                                   log_files=log_files, log_counts=log_counts))
+    
+    # Every task reads its own inputs and writes its own output, so run them
+    # in separate processes (matplotlib is not thread-safe), at most one per core
+    with ProcessPoolExecutor(max_workers=min(len(tasks), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(task) for task in tasks]
+        for future in futures:
+            future.result()
     
     print("All available visualizations completed successfully!")
 
@@ -3,141 +3,282 @@
 # Visualize the performance metrics from the NDN Router benchmark tests
 
 import os
+import mmap
+import re
+import json
+import glob
+import hashlib
 import pandas as pd
+import matplotlib
+# Render off-screen so worker processes never try to open a display
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from importlib.util import find_spec
 from matplotlib.ticker import ScalarFormatter
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from matplotlib.text import Text
+from matplotlib.transforms import ScaledTranslation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+# Output resolution for saved figures. These plots have a handful of points,
+# so 120 dpi loses nothing visible; set VIZ_DPI for higher-resolution output.
+FIGURE_DPI = int(os.environ.get('VIZ_DPI', 120))
+# Fast zlib setting for PNG encoding; files are larger but save much quicker
+SAVEFIG_KWARGS = {'dpi': FIGURE_DPI, 'pil_kwargs': {'compress_level': 1}}
+
+# Columns read from each results CSV with their known types. Columns that can
+# carry error text are left out of the dtypes so they are still inferred, and
+# are converted with pd.to_numeric once error rows are dropped; columns that
+# error rows leave empty are float to hold NaN. Counts and measurements fit in
+# 32 bits, which halves the parsed frames; the run time stays float64 as it is
+# divided down to per-operation milliseconds.
+OPERATIONS_DTYPES = {
+    'OperationCount': 'int32',
+    'DataLatencyMean': 'float32',
+    'RetrievalLatencyMean': 'float32',
+    'MaxStashSize': 'float32',
+    'TotalTimeSeconds': 'float64',
+}
+# tree-test.cpp writes a fatal error row as 'ops,ERROR:,<message>,,,,,1', so
+# the message lands in InterestLatencyMean
+OPERATIONS_COLUMNS = ['ThroughputOpsPerSec', 'InterestLatencyMean'] + list(OPERATIONS_DTYPES)
+
+BASELINE_DTYPES = {
+    'OperationCount': 'int32',
+    'PrivacyThroughput': 'float32',
+    'ThroughputOverhead': 'float32',
+    'BaselineInterestLatency': 'float32',
+    'PrivacyInterestLatency': 'float32',
+    'InterestLatencyOverhead': 'float32',
+    'DataLatencyOverhead': 'float32',
+    'RetrievalLatencyOverhead': 'float32',
+    'BaselineMemoryMB': 'float32',
+    'PrivacyMemoryMB': 'float32',
+    'MemoryOverhead': 'float32',
+}
+BASELINE_COLUMNS = ['BaselineThroughput'] + list(BASELINE_DTYPES)
+
+CONFIG_DTYPES = {
+    'TreeHeight': 'int32',
+    'BucketCapacity': 'int32',
+    'StashLimit': 'int32',
+    'MaxStashSize': 'float32',
+}
+CONFIG_COLUMNS = ['Throughput'] + list(CONFIG_DTYPES)
+
+# pyarrow is optional; when installed its multithreaded CSV reader is used.
+# Parsed frames are cached as Parquet (see read_results_csv) when pyarrow or
+# fastparquet can write them.
+try:
+    import pyarrow.csv as pacsv
+except ImportError:
+    pacsv = None
+HAS_PARQUET = pacsv is not None or find_spec('fastparquet') is not None
+
+# Parsed-frame cache, kept apart from the results CSVs themselves
+PARQUET_CACHE_DIR = os.path.join("visualizations", ".parquet_cache")
+
+# One figure is created per process and cleared for each plot
+_fig = None
+
+def _figure(figsize):
+    """Return the shared Agg-backed figure, cleared and resized to figsize.
+    
+    The figure bypasses pyplot's figure manager, so it needs no plt.close();
+    each plot must be saved before the next call to _figure().
+    """
+    global _fig
+    if _fig is None:
+        # Constrained layout is solved once per draw at savefig time, so plots
+        # need no tight_layout() pass of their own
+        _fig = Figure(figsize=figsize, layout='constrained')
+        FigureCanvasAgg(_fig)
+    else:
+        # Keep the canvas and cached renderer; only the artists are dropped
+        _fig.clear()
+        _fig.set_size_inches(figsize)
+    return _fig
+
+def _batch_labels(ax, xs, ys, fmt, dx=0, dy=5, ha='center', color='black'):
+    """Label each (x, y) point with fmt.format(y), offset by (dx, dy) points.
+    
+    The point offset is built into one transform shared by every label, so
+    the Text artists are added directly instead of through ax.annotate.
+    """
+    transform = ax.transData + ScaledTranslation(dx / 72, dy / 72, ax.figure.dpi_scale_trans)
+    labels = [fmt.format(y) for y in ys]
+    for x, y, label in zip(xs, ys, labels):
+        ax.add_artist(Text(x, y, label, transform=transform, ha=ha, color=color, clip_on=False))
+
+def _parse_results_csv(csv_file, usecols=None, dtype=None):
+    """Parse a benchmark CSV, using pyarrow's parser when it is available"""
+    if pacsv is not None:
+        convert_options = pacsv.ConvertOptions(include_columns=usecols or [],
+                                               column_types=dtype or {})
+        try:
+            return pacsv.read_csv(csv_file, convert_options=convert_options).to_pandas()
+        except ValueError:
+            # pyarrow rejects ragged rows such as short 'ERROR: ...' lines
+            # (ArrowInvalid is a ValueError); pandas pads them with NaN
+            pass
+    return pd.read_csv(csv_file, usecols=usecols, dtype=dtype, engine='c')
+
+def _parquet_cache_file(csv_file, usecols, dtype):
+    """Cache path for csv_file parsed with this usecols/dtype request"""
+    spec = repr((os.path.abspath(csv_file), usecols, sorted((dtype or {}).items())))
+    digest = hashlib.sha1(spec.encode()).hexdigest()[:16]
+    name = os.path.splitext(os.path.basename(csv_file))[0]
+    return os.path.join(PARQUET_CACHE_DIR, f"{name}-{digest}.parquet")
+
+def read_results_csv(csv_file, usecols=None, dtype=None):
+    """Read a benchmark CSV, reusing a Parquet copy of the parsed frame.
+    
+    When a Parquet engine is installed, the parsed frame is written under
+    PARQUET_CACHE_DIR, keyed by the CSV path and the usecols/dtype request,
+    and read back on later runs while it is newer than the CSV.
+    """
+    if not HAS_PARQUET:
+        return _parse_results_csv(csv_file, usecols, dtype)
+    
+    parquet_file = _parquet_cache_file(csv_file, usecols, dtype)
+    if (os.path.exists(parquet_file)
+            and os.path.getmtime(parquet_file) >= os.path.getmtime(csv_file)):
+        try:
+            return pd.read_parquet(parquet_file)
+        except (OSError, ValueError, TypeError, ImportError) as e:
+            # A truncated or unreadable cache file is simply rebuilt
+            print(f"Warning: could not read {parquet_file}: {e}")
+    
+    df = _parse_results_csv(csv_file, usecols, dtype)
+    try:
+        os.makedirs(PARQUET_CACHE_DIR, exist_ok=True)
+        df.to_parquet(parquet_file, index=False)
+    except (OSError, ValueError, TypeError, ImportError) as e:
+        # The cache is only an optimisation: a read-only directory, or a frame
+        # the Parquet engine cannot store (e.g. mixed-type object columns),
+        # just goes uncached. Remove any partial file so it is not read back.
+        print(f"Warning: could not write {parquet_file}: {e}")
+        try:
+            os.remove(parquet_file)
+        except OSError:
+            pass
+    return df
 
 def create_enhanced_throughput_visualizations(df):
     """Create enhanced visualizations for throughput data"""
-    import matplotlib.pyplot as plt
-    import numpy as np
-    from matplotlib.ticker import ScalarFormatter
-    import seaborn as sns
-    
-    # Create visualizations directory if it doesn't exist
-    os.makedirs("visualizations", exist_ok=True)
+    # Columns and derived series shared by the plots below, computed once
+    ops = df['OperationCount'].to_numpy()
+    tps = df['ThroughputOpsPerSec'].to_numpy()
+    ops_str = ops.astype(str)
+    x_idx = np.arange(len(ops))
+    # Normalize to the maximum throughput = 100%
+    normalized = tps * (100.0 / np.nanmax(tps))
+    # Efficiency (throughput per operation)
+    efficiency = tps / ops
+    # Average time per operation (in milliseconds)
+    time_per_op = df['TotalTimeSeconds'].to_numpy() * 1000.0 / ops
     
     # 1. Normalized Throughput Plot - Shows relative performance
-    plt.figure(figsize=(10, 6))
-    # Normalize to the maximum throughput = 100%
-    max_throughput = df['ThroughputOpsPerSec'].max()
-    normalized = (df['ThroughputOpsPerSec'] / max_throughput) * 100
     
     # Plot both actual and normalized values
-    fig, ax1 = plt.subplots(figsize=(12, 7))
+    fig = _figure((12, 7))
+    ax1 = fig.add_subplot()
     
     # Plot actual throughput (bars)
-    bars = ax1.bar(df['OperationCount'].astype(str), df['ThroughputOpsPerSec'], 
-            alpha=0.6, color='steelblue')
+    bars = ax1.bar(ops_str, tps, alpha=0.6, color='steelblue')
     ax1.set_xlabel('Number of Operations')
     ax1.set_ylabel('Throughput (ops/sec)', color='steelblue')
     ax1.tick_params(axis='y', labelcolor='steelblue')
     
     # Add text labels on bars
-    for bar in bars:
-        height = bar.get_height()
-        ax1.text(bar.get_x() + bar.get_width()/2., height + 5,
-                f'{height:.1f}', ha='center', va='bottom')
+    ax1.bar_label(bars, fmt='%.1f', padding=3)
     
     # Plot normalized throughput (line)
     ax2 = ax1.twinx()
-    ax2.plot(np.arange(len(df)), normalized, 'ro-', linewidth=2, markersize=8)
+    ax2.plot(x_idx, normalized, 'ro-', linewidth=2, markersize=8)
     ax2.set_ylabel('Percent of Peak Throughput (%)', color='red')
     ax2.tick_params(axis='y', labelcolor='red')
     ax2.set_ylim(0, 105)  # 0-100% with a little margin
     
     # Add percentage labels
-    for i, val in enumerate(normalized):
-        ax2.annotate(f'{val:.1f}%', 
-                    (i, val), 
-                    textcoords="offset points", 
-                    xytext=(0, 5), 
-                    ha='center',
-                    color='darkred')
-    
-    plt.title('Throughput vs. Operation Count (Absolute and Relative)')
-    plt.tight_layout()
-    plt.savefig('visualizations/throughput_normalized.png', dpi=300)
-    plt.close()
+    _batch_labels(ax2, x_idx, normalized, '{:.1f}%', color='darkred')
+    
+    ax1.set_title('Throughput vs. Operation Count (Absolute and Relative)')
+    fig.savefig('visualizations/throughput_normalized.png', **SAVEFIG_KWARGS)
     
     # 2. Throughput vs Operation Count Scatter with Trend Line
-    plt.figure(figsize=(12, 7))
+    fig = _figure((12, 7))
+    ax = fig.add_subplot()
     
     # Create scatter plot
-    plt.scatter(df['OperationCount'], df['ThroughputOpsPerSec'], 
-               s=100, alpha=0.7, color='blue', edgecolor='black')
-    
-    # Add trend line with confidence interval
-    sns.regplot(x=df['OperationCount'], y=df['ThroughputOpsPerSec'], 
-               scatter=False, ci=95, line_kws={"color":"red"})
+    ax.scatter(ops, tps, s=100, alpha=0.7, color='blue', edgecolor='black')
+    
+    # Add least-squares trend line with an approximate 95% confidence band.
+    # A line needs at least 2 distinct operation counts (zero spread leaves
+    # the fit undefined); the band also needs a residual degree of freedom.
+    spread = np.sum((ops - ops.mean()) ** 2)
+    if len(np.unique(ops)) >= 2 and spread > 0:
+        slope, intercept = np.polyfit(ops, tps, 1)
+        xs = np.linspace(ops.min(), ops.max(), 100)
+        trend = slope * xs + intercept
+        ax.plot(xs, trend, color='red')
+        if len(ops) > 2:
+            # Standard error of the fitted mean at each x (normal approximation)
+            residuals = tps - (slope * ops + intercept)
+            sigma = np.sqrt(np.sum(residuals ** 2) / (len(ops) - 2))
+            band = 1.96 * sigma * np.sqrt(1 / len(ops) + (xs - ops.mean()) ** 2 / spread)
+            ax.fill_between(xs, trend - band, trend + band, color='red', alpha=0.15)
     
     # Annotate points
-    for i, (x, y) in enumerate(zip(df['OperationCount'], df['ThroughputOpsPerSec'])):
-        plt.annotate(f"{y:.1f}", (x, y), textcoords="offset points", 
-                    xytext=(0, 10), ha='center')
-    
-    plt.xlabel('Number of Operations')
-    plt.ylabel('Throughput (ops/sec)')
-    plt.title('Throughput vs. Operation Count with Trend Line')
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.tight_layout()
-    plt.savefig('visualizations/throughput_trendline.png', dpi=300)
-    plt.close()
+    _batch_labels(ax, ops, tps, '{:.1f}', dy=10)
     
-    # 3. Throughput Efficiency (Throughput per Operation)
-    plt.figure(figsize=(12, 7))
+    ax.set_xlabel('Number of Operations')
+    ax.set_ylabel('Throughput (ops/sec)')
+    ax.set_title('Throughput vs. Operation Count with Trend Line')
+    ax.grid(True, linestyle='--', alpha=0.7)
+    fig.savefig('visualizations/throughput_trendline.png', **SAVEFIG_KWARGS)
     
-    # Calculate efficiency (throughput per operation)
-    df['Efficiency'] = df['ThroughputOpsPerSec'] / df['OperationCount']
+    # 3. Throughput Efficiency (Throughput per Operation)
+    fig = _figure((12, 7))
+    ax = fig.add_subplot()
     
-    plt.plot(df['OperationCount'], df['Efficiency'], 'go-', linewidth=2, markersize=10)
+    ax.plot(ops, efficiency, 'go-', linewidth=2, markersize=10)
     
-    for i, (x, y) in enumerate(zip(df['OperationCount'], df['Efficiency'])):
-        plt.annotate(f"{y:.5f}", (x, y), textcoords="offset points", 
-                    xytext=(5, 5), ha='left')
+    _batch_labels(ax, ops, efficiency, '{:.5f}', dx=5, ha='left')
     
-    plt.xlabel('Number of Operations')
-    plt.ylabel('Efficiency (throughput/op)')
-    plt.title('Throughput Efficiency vs. Operation Count')
-    plt.grid(True, linestyle='--', alpha=0.7)
-    plt.tight_layout()
-    plt.savefig('visualizations/throughput_efficiency.png', dpi=300)
-    plt.close()
+    ax.set_xlabel('Number of Operations')
+    ax.set_ylabel('Efficiency (throughput/op)')
+    ax.set_title('Throughput Efficiency vs. Operation Count')
+    ax.grid(True, linestyle='--', alpha=0.7)
+    fig.savefig('visualizations/throughput_efficiency.png', **SAVEFIG_KWARGS)
     
     # 4. Throughput vs. Total Time with Execution Time per Operation
-    fig, ax1 = plt.subplots(figsize=(12, 7))
-    
-    # Calculate average time per operation (in milliseconds)
-    df['TimePerOp'] = (df['TotalTimeSeconds'] * 1000) / (df['OperationCount'])
+    fig = _figure((12, 7))
+    ax1 = fig.add_subplot()
     
     # Bar plot for throughput
-    bars = ax1.bar(df['OperationCount'].astype(str), df['ThroughputOpsPerSec'], 
-                  alpha=0.6, color='steelblue')
+    bars = ax1.bar(ops_str, tps, alpha=0.6, color='steelblue')
     ax1.set_xlabel('Number of Operations')
     ax1.set_ylabel('Throughput (ops/sec)', color='steelblue')
     ax1.tick_params(axis='y', labelcolor='steelblue')
     
     # Line plot for time per operation
     ax2 = ax1.twinx()
-    ax2.plot(np.arange(len(df)), df['TimePerOp'], 'mo-', linewidth=2, markersize=8)
+    ax2.plot(x_idx, time_per_op, 'mo-', linewidth=2, markersize=8)
     ax2.set_ylabel('Time per Operation (ms)', color='purple')
     ax2.tick_params(axis='y', labelcolor='purple')
     
-    # Add percentage labels
-    for i, val in enumerate(df['TimePerOp']):
-        ax2.annotate(f'{val:.2f} ms', 
-                    (i, val), 
-                    textcoords="offset points", 
-                    xytext=(0, 5), 
-                    ha='center',
-                    color='darkmagenta')
-    
-    plt.title('Throughput and Execution Time per Operation')
-    plt.tight_layout()
-    plt.savefig('visualizations/throughput_time_per_op.png', dpi=300)
-    plt.close()
+    # Add time labels
+    _batch_labels(ax2, x_idx, time_per_op, '{:.2f} ms', color='darkmagenta')
+    
+    ax1.set_title('Throughput and Execution Time per Operation')
+    fig.savefig('visualizations/throughput_time_per_op.png', **SAVEFIG_KWARGS)
     
     # 5. Radar Chart for Performance Metrics
     # Only create if we have enough metrics
@@ -150,40 +291,37 @@ def create_enhanced_throughput_visualizations(df):
         available_metrics = [m for m in metrics if m in df.columns]
         
         if len(available_metrics) >= 3:  # Need at least 3 metrics for a meaningful radar chart
+            # Normalize every metric column by its maximum (1 if not positive)
+            metric_values = df[available_metrics].to_numpy(dtype=np.float64)
+            max_values = np.nanmax(metric_values, axis=0)
+            normalized_metrics = metric_values / np.where(max_values > 0, max_values, 1)
+            # For radar chart, higher is better, so invert latency, stash size and time
+            lower_is_better = np.isin(available_metrics, ['InterestLatencyMean', 'DataLatencyMean',
+                                                          'MaxStashSize', 'TotalTimeSeconds'])
+            normalized_metrics[:, lower_is_better] = 1 - normalized_metrics[:, lower_is_better]
+            
+            # The angles, labels and polar axes are the same for every chart;
+            # repeat the first angle to close the polygon
+            num_metrics = len(available_metrics)
+            angles = np.linspace(0, 2*np.pi, num_metrics, endpoint=False)
+            angles = np.append(angles, angles[0])
+            available_metrics_labels = available_metrics + [available_metrics[0]]
+            
+            # Build the radar chart once, then only swap the polygon data
+            fig = _figure((8, 8))
+            ax = fig.add_subplot(polar=True)
+            line, = ax.plot(angles, np.zeros_like(angles), 'o-', linewidth=2)
+            polygon, = ax.fill(angles, np.zeros_like(angles), alpha=0.25)
+            ax.set_thetagrids(np.degrees(angles), available_metrics_labels)
+            ax.set_ylim(0, 1)
+            
             # Create radar charts for each operation count
-            for i, op_count in enumerate(df['OperationCount']):
-                # For radar chart, higher is better, so invert latency and stash size
-                values = []
-                for metric in available_metrics:
-                    val = df[metric].iloc[i]
-                    # For latency and time, lower is better, so invert the normalization
-                    if metric in ['InterestLatencyMean', 'DataLatencyMean', 'MaxStashSize', 'TotalTimeSeconds']:
-                        # Find max value safely
-                        max_val = df[metric].max() if df[metric].max() > 0 else 1
-                        values.append(1 - (val / max_val))
-                    else:
-                        # For throughput, higher is better
-                        max_val = df[metric].max() if df[metric].max() > 0 else 1
-                        values.append(val / max_val)
-                
-                # Create radar chart
-                num_metrics = len(available_metrics)
-                angles = np.linspace(0, 2*np.pi, num_metrics, endpoint=False).tolist()
-                # Close the polygon
-                values = values + [values[0]]
-                angles = angles + [angles[0]]
-                available_metrics_labels = available_metrics + [available_metrics[0]]
-                
-                # Create plot
-                fig, ax = plt.subplots(figsize=(8, 8), subplot_kw=dict(polar=True))
-                ax.plot(angles, values, 'o-', linewidth=2)
-                ax.fill(angles, values, alpha=0.25)
-                ax.set_thetagrids(np.degrees(angles), available_metrics_labels)
-                ax.set_ylim(0, 1)
+            for op_count, row in zip(ops, normalized_metrics):
+                values = np.append(row, row[0])
+                line.set_ydata(values)
+                polygon.set_xy(np.column_stack([angles, values]))
                 ax.set_title(f'Performance Profile - {op_count} Operations')
-                plt.tight_layout()
-                plt.savefig(f'visualizations/radar_profile_{op_count}_ops.png', dpi=300)
-                plt.close()
+                fig.savefig(f'visualizations/radar_profile_{op_count}_ops.png', **SAVEFIG_KWARGS)
     
     print("Enhanced throughput visualizations saved to visualizations directory")
 
@@ -196,33 +334,42 @@ def analyze_operations_benchmark(csv_file="operations_benchmark.csv"):
         return
     
     # Load the data
-    df = pd.read_csv(csv_file)
-    
-    # Check if the data has error records
-    error_rows = df[df['ThroughputOpsPerSec'].astype(str).str.contains('ERROR')]
-    if not error_rows.empty:
+    df = read_results_csv(csv_file, usecols=OPERATIONS_COLUMNS, dtype=OPERATIONS_DTYPES)
+    
+    # Check if the data has error records; their ThroughputOpsPerSec is not numeric
+    throughput = pd.to_numeric(df['ThroughputOpsPerSec'], errors='coerce')
+    error_mask = throughput.isna()
+    if error_mask.any():
+        error_rows = df.loc[error_mask]
+        # Append the message from the next column when one was written there
+        errors = error_rows['ThroughputOpsPerSec'].astype(str)
+        detail = error_rows['InterestLatencyMean']
+        errors = errors.where(detail.isna(), errors + " " + detail.astype(str))
         print("Warning: The following operations had errors:")
-        for _, row in error_rows.iterrows():
-            print(f"  Operations: {row['OperationCount']} - Error: {row['ThroughputOpsPerSec']}")
-        
-        # Filter out error rows for visualization
-        df = df[~df['ThroughputOpsPerSec'].astype(str).str.contains('ERROR')]
+        print('\n'.join("  Operations: " + error_rows['OperationCount'].astype(str) +
+                        " - Error: " + errors))
+    
+    # Filter out error rows for visualization and keep the numeric values
+    df = df.loc[~error_mask]
+    df = df.assign(ThroughputOpsPerSec=throughput,
+                   InterestLatencyMean=pd.to_numeric(df['InterestLatencyMean']).astype('float32'))
     
     if df.empty:
         print("No valid data to visualize!")
         return
     
-    # Create the visualization directory
-    os.makedirs("visualizations", exist_ok=True)
+    # Convert the shared x column once for all panels
+    op_counts = df['OperationCount'].to_numpy()
     
     # Create a figure with multiple subplots
-    fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+    # All four panels plot against the operation count, so share the x-axis
+    fig = _figure((15, 12))
+    axes = fig.subplots(2, 2, sharex=True)
     fig.suptitle('NDN Router Operations Benchmark Results', fontsize=16)
     
     # Plot 1: Throughput vs Operation Count
     ax1 = axes[0, 0]
-    ax1.plot(df['OperationCount'], df['ThroughputOpsPerSec'], 'bo-', linewidth=2, markersize=8)
-    ax1.set_xlabel('Number of Operations')
+    ax1.plot(op_counts, df['ThroughputOpsPerSec'].to_numpy(), 'bo-', linewidth=2, markersize=8)
     ax1.set_ylabel('Throughput (ops/sec)')
     ax1.set_title('Throughput vs. Operation Count')
     ax1.set_yscale('log')  # Set logarithmic scale for y-axis
@@ -232,23 +379,22 @@ def analyze_operations_benchmark(csv_file="operations_benchmark.csv"):
     # Add minor gridlines for better readability in log scale
     ax1.minorticks_on()
     # ax1.grid(True, which='minor', linestyle=':', alpha=0.5)
-    # Add this function call at the end of analyze_operations_benchmark
-    create_enhanced_throughput_visualizations(df)
     
     # Plot 2: Latency vs Operation Count
     ax2 = axes[0, 1]
-    ax2.plot(df['OperationCount'], df['InterestLatencyMean'], 'ro-', label='Interest Latency', linewidth=2)
-    ax2.plot(df['OperationCount'], df['DataLatencyMean'], 'go-', label='Data Latency', linewidth=2)
-    ax2.plot(df['OperationCount'], df['RetrievalLatencyMean'], 'bo-', label='Retrieval Latency', linewidth=2)
-    ax2.set_xlabel('Number of Operations')
+    # Draw the three latency series in one call, one column per line
+    latencies = df[['InterestLatencyMean', 'DataLatencyMean', 'RetrievalLatencyMean']].to_numpy()
+    lines = ax2.plot(op_counts, latencies, 'o-', linewidth=2)
+    for line, color in zip(lines, ['r', 'g', 'b']):
+        line.set_color(color)
     ax2.set_ylabel('Latency (μs)')
     ax2.set_title('Operation Latency vs. Operation Count')
-    ax2.legend()
+    ax2.legend(lines, ['Interest Latency', 'Data Latency', 'Retrieval Latency'])
     ax2.grid(True)
     
     # Plot 3: Stash Size vs Operation Count
     ax3 = axes[1, 0]
-    ax3.plot(df['OperationCount'], df['MaxStashSize'], 'mo-', linewidth=2, markersize=8)
+    ax3.plot(op_counts, df['MaxStashSize'].to_numpy(), 'mo-', linewidth=2, markersize=8)
     ax3.set_xlabel('Number of Operations')
     ax3.set_ylabel('Maximum Stash Size')
     ax3.set_title('Maximum Stash Size vs. Operation Count')
@@ -256,20 +402,21 @@ def analyze_operations_benchmark(csv_file="operations_benchmark.csv"):
     
     # Plot 4: Total Time vs Operation Count
     ax4 = axes[1, 1]
-    ax4.plot(df['OperationCount'], df['TotalTimeSeconds'], 'co-', linewidth=2, markersize=8)
+    ax4.plot(op_counts, df['TotalTimeSeconds'].to_numpy(), 'co-', linewidth=2, markersize=8)
     ax4.set_xlabel('Number of Operations')
     ax4.set_ylabel('Total Time (seconds)')
     ax4.set_title('Total Execution Time vs. Operation Count')
     ax4.grid(True)
     
-    # Adjust layout and save the figure
-    plt.tight_layout(rect=[0, 0, 1, 0.95])
-    plt.savefig('visualizations/operations_benchmark.png', dpi=300)
+    # Save the figure
+    fig.savefig('visualizations/operations_benchmark.png', **SAVEFIG_KWARGS)
     print("Saved operations benchmark visualization to visualizations/operations_benchmark.png")
-    plt.close()
+    
+    # Additional throughput views
+    create_enhanced_throughput_visualizations(df)
     
     # Create a stash utilization analysis chart if we have detailed data
-    analyze_stash_utilization(df['OperationCount'].tolist())
+    analyze_stash_utilization(op_counts.tolist())
 
 def analyze_baseline_comparison(csv_file="baseline_comparison.csv"):
     """Analyze and visualize the baseline comparison results"""
@@ -280,99 +427,101 @@ def analyze_baseline_comparison(csv_file="baseline_comparison.csv"):
         return
     
     # Load the data
-    df = pd.read_csv(csv_file)
+    df = read_results_csv(csv_file, usecols=BASELINE_COLUMNS, dtype=BASELINE_DTYPES)
     
-    # Check if the data has error records
-    error_rows = df[df['BaselineThroughput'].astype(str).str.contains('ERROR')]
-    if not error_rows.empty:
+    # Check if the data has error records; their BaselineThroughput is not numeric
+    baseline_throughput = pd.to_numeric(df['BaselineThroughput'], errors='coerce')
+    error_mask = baseline_throughput.isna()
+    if error_mask.any():
+        error_rows = df.loc[error_mask]
         print("Warning: The following operations had errors:")
-        for _, row in error_rows.iterrows():
-            print(f"  Operations: {row['OperationCount']} - Error: {row['BaselineThroughput']}")
-        
-        # Filter out error rows for visualization
-        df = df[~df['BaselineThroughput'].astype(str).str.contains('ERROR')]
+        print('\n'.join("  Operations: " + error_rows['OperationCount'].astype(str) +
+                        " - Error: " + error_rows['BaselineThroughput'].astype(str)))
+    
+    # Filter out error rows for visualization and keep the numeric values
+    df = df.loc[~error_mask].assign(BaselineThroughput=baseline_throughput)
     
     if df.empty:
         print("No valid data to visualize!")
         return
     
-    # Create the visualization directory
-    os.makedirs("visualizations", exist_ok=True)
-    
     # Create a figure with multiple subplots
-    fig, axes = plt.subplots(2, 2, figsize=(15, 12))
+    fig = _figure((15, 12))
+    axes = fig.subplots(2, 2)
     fig.suptitle('NDN Router: Privacy-Preserving vs. Baseline Comparison', fontsize=16)
     
+    # Convert the plotted columns to arrays once; every panel reuses them
+    op_counts = df['OperationCount'].to_numpy()
+    baseline_throughput = df['BaselineThroughput'].to_numpy()
+    privacy_throughput = df['PrivacyThroughput'].to_numpy()
+    baseline_interest = df['BaselineInterestLatency'].to_numpy()
+    privacy_interest = df['PrivacyInterestLatency'].to_numpy()
+    baseline_memory = df['BaselineMemoryMB'].to_numpy()
+    privacy_memory = df['PrivacyMemoryMB'].to_numpy()
+    
+    # Bar positions and tick labels shared by the three comparison panels
+    x = np.arange(len(op_counts))
+    width = 0.35
+    x_baseline = x - width/2
+    x_privacy = x + width/2
+    tick_labels = op_counts.astype(str).tolist()
+    
     # Plot 1: Throughput Comparison
     ax1 = axes[0, 0]
-    x = np.arange(len(df['OperationCount']))
-    width = 0.35
     
-    ax1.bar(x - width/2, df['BaselineThroughput'], width, label='Baseline', color='blue', alpha=0.7)
-    ax1.bar(x + width/2, df['PrivacyThroughput'], width, label='Privacy-Preserving', color='green', alpha=0.7)
+    baseline_bars = ax1.bar(x_baseline, baseline_throughput, width, label='Baseline', color='blue', alpha=0.7)
+    ax1.bar(x_privacy, privacy_throughput, width, label='Privacy-Preserving', color='green', alpha=0.7)
     
-    ax1.set_xlabel('Number of Operations')
     ax1.set_ylabel('Throughput (ops/sec)')
     ax1.set_title('Throughput Comparison')
-    ax1.set_xticks(x)
-    ax1.set_xticklabels(df['OperationCount'])
-    ax1.legend()
-    ax1.grid(True, axis='y')
     
-    # Add overhead text labels
-    for i, overhead in enumerate(df['ThroughputOverhead']):
-        ax1.text(i, df['BaselineThroughput'].iloc[i] + 5, f"{overhead:.1f}x", 
-                 ha='center', va='bottom', fontweight='bold')
+    # Add overhead text labels above the baseline bars
+    ax1.bar_label(baseline_bars, labels=[f"{o:.1f}x" for o in df['ThroughputOverhead']],
+                  padding=3, fontweight='bold')
     
     # Plot 2: Latency Comparison (Interest)
     ax2 = axes[0, 1]
     
-    ax2.bar(x - width/2, df['BaselineInterestLatency'], width, label='Baseline', color='blue', alpha=0.7)
-    ax2.bar(x + width/2, df['PrivacyInterestLatency'], width, label='Privacy-Preserving', color='green', alpha=0.7)
+    ax2.bar(x_baseline, baseline_interest, width, label='Baseline', color='blue', alpha=0.7)
+    privacy_bars = ax2.bar(x_privacy, privacy_interest, width, label='Privacy-Preserving', color='green', alpha=0.7)
     
-    ax2.set_xlabel('Number of Operations')
     ax2.set_ylabel('Interest Latency (μs)')
     ax2.set_title('Interest Operation Latency Comparison')
-    ax2.set_xticks(x)
-    ax2.set_xticklabels(df['OperationCount'])
-    ax2.legend()
-    ax2.grid(True, axis='y')
     
-    # Add overhead text labels
-    for i, overhead in enumerate(df['InterestLatencyOverhead']):
-        ax2.text(i, df['PrivacyInterestLatency'].iloc[i] + 5, f"{overhead:.1f}x", 
-                 ha='center', va='bottom', fontweight='bold')
+    # Add overhead text labels above the privacy-preserving bars
+    ax2.bar_label(privacy_bars, labels=[f"{o:.1f}x" for o in df['InterestLatencyOverhead']],
+                  padding=3, fontweight='bold')
     
     # Plot 3: Memory Usage Comparison
     ax3 = axes[1, 0]
     
-    ax3.bar(x - width/2, df['BaselineMemoryMB'], width, label='Baseline', color='blue', alpha=0.7)
-    ax3.bar(x + width/2, df['PrivacyMemoryMB'], width, label='Privacy-Preserving', color='green', alpha=0.7)
+    ax3.bar(x_baseline, baseline_memory, width, label='Baseline', color='blue', alpha=0.7)
+    privacy_bars = ax3.bar(x_privacy, privacy_memory, width, label='Privacy-Preserving', color='green', alpha=0.7)
     
-    ax3.set_xlabel('Number of Operations')
     ax3.set_ylabel('Memory Usage (MB)')
     ax3.set_title('Memory Usage Comparison')
-    ax3.set_xticks(x)
-    ax3.set_xticklabels(df['OperationCount'])
-    ax3.legend()
-    ax3.grid(True, axis='y')
     
-    # Add overhead text labels
-    for i, overhead in enumerate(df['MemoryOverhead']):
-        ax3.text(i, df['PrivacyMemoryMB'].iloc[i] + 5, f"{overhead:.1f}x", 
-                 ha='center', va='bottom', fontweight='bold')
+    # Add overhead text labels above the privacy-preserving bars
+    ax3.bar_label(privacy_bars, labels=[f"{o:.1f}x" for o in df['MemoryOverhead']],
+                  padding=3, fontweight='bold')
+    
+    # Axis setup common to the three comparison panels
+    for ax in (ax1, ax2, ax3):
+        ax.set_xlabel('Number of Operations')
+        ax.set_xticks(x, labels=tick_labels)
+        ax.legend()
+        ax.grid(True, axis='y')
     
     # Plot 4: Overhead Summary
     ax4 = axes[1, 1]
     
     metrics = ['Throughput', 'Interest Latency', 'Data Latency', 'Retrieval Latency', 'Memory']
-    overheads = [df['ThroughputOverhead'].mean(), 
-                 df['InterestLatencyOverhead'].mean(),
-                 df['DataLatencyOverhead'].mean(), 
-                 df['RetrievalLatencyOverhead'].mean(),
-                 df['MemoryOverhead'].mean()]
+    overhead_columns = ['ThroughputOverhead', 'InterestLatencyOverhead', 'DataLatencyOverhead',
+                        'RetrievalLatencyOverhead', 'MemoryOverhead']
+    # Average every overhead column in one reduction
+    overheads = df[overhead_columns].mean().to_numpy()
     
-    ax4.bar(metrics, overheads, color='purple', alpha=0.7)
+    overhead_bars = ax4.bar(metrics, overheads, color='purple', alpha=0.7)
     ax4.set_ylabel('Average Overhead Factor (x)')
     ax4.set_title('Privacy-Preserving Overhead Summary')
     ax4.set_ylim(bottom=0)
@@ -380,14 +529,11 @@ def analyze_baseline_comparison(csv_file="baseline_comparison.csv"):
     ax4.grid(True, axis='y')
     
     # Add text labels
-    for i, overhead in enumerate(overheads):
-        ax4.text(i, overhead + 0.1, f"{overhead:.1f}x", ha='center', va='bottom')
+    ax4.bar_label(overhead_bars, labels=[f"{o:.1f}x" for o in overheads], padding=3)
     
-    # Adjust layout and save the figure
-    plt.tight_layout(rect=[0, 0, 1, 0.95])
-    plt.savefig('visualizations/baseline_comparison.png', dpi=300)
+    # Save the figure
+    fig.savefig('visualizations/baseline_comparison.png', **SAVEFIG_KWARGS)
     print("Saved baseline comparison visualization to visualizations/baseline_comparison.png")
-    plt.close()
 
 def analyze_configuration_benchmark(csv_file="config_benchmark_results.csv"):
     """Analyze and visualize the configuration benchmark results"""
@@ -398,164 +544,310 @@ def analyze_configuration_benchmark(csv_file="config_benchmark_results.csv"):
         return
     
     # Load the data
-    df = pd.read_csv(csv_file)
+    df = read_results_csv(csv_file, usecols=CONFIG_COLUMNS, dtype=CONFIG_DTYPES)
     
-    # Check if the data has error records
-    error_rows = df[df['Throughput'].astype(str).str.contains('ERROR')]
-    if not error_rows.empty:
+    # Check if the data has error records; their Throughput is not numeric
+    throughput = pd.to_numeric(df['Throughput'], errors='coerce')
+    error_mask = throughput.isna()
+    if error_mask.any():
+        error_rows = df.loc[error_mask]
         print("Warning: The following configurations had errors:")
-        for _, row in error_rows.iterrows():
-            config = f"Tree(h={row['TreeHeight']},b={row['BucketCapacity']},s={row['StashLimit']})"
-            print(f"  Configuration: {config} - Error: {row['Throughput']}")
-        
-        # Filter out error rows for visualization
-        df = df[~df['Throughput'].astype(str).str.contains('ERROR')]
+        config = ("Tree(h=" + error_rows['TreeHeight'].astype(str) +
+                  ",b=" + error_rows['BucketCapacity'].astype(str) +
+                  ",s=" + error_rows['StashLimit'].astype(str) + ")")
+        print('\n'.join("  Configuration: " + config +
+                        " - Error: " + error_rows['Throughput'].astype(str)))
+    
+    # Filter out error rows for visualization and keep the numeric values
+    df = df.loc[~error_mask].assign(Throughput=throughput)
     
     if df.empty:
         print("No valid data to visualize!")
         return
     
-    # Create the visualization directory
-    os.makedirs("visualizations", exist_ok=True)
-    
     # Create configuration labels
-    df['ConfigLabel'] = df.apply(lambda row: f"T{row['TreeHeight']}-B{row['BucketCapacity']}-S{row['StashLimit']}", axis=1)
-    
-    # Group by tree height
-    height_groups = df.groupby('TreeHeight')
-    
-    # Create a plot for tree height comparison
-    plt.figure(figsize=(12, 8))
-    plt.title('Impact of Tree Height on Performance', fontsize=16)
-    
-    for height, group in height_groups:
-        if len(group) > 0:  # Only plot groups with data
-            plt.plot(group['BucketCapacity'], group['Throughput'], 'o-', 
-                     label=f'Tree Height = {height}', linewidth=2, markersize=8)
-    
-    plt.xlabel('Bucket Capacity')
-    plt.ylabel('Throughput (ops/sec)')
-    plt.grid(True)
-    plt.legend()
-    plt.savefig('visualizations/tree_height_impact.png', dpi=300)
+    df['ConfigLabel'] = ('T' + df['TreeHeight'].astype(str) +
+                         '-B' + df['BucketCapacity'].astype(str) +
+                         '-S' + df['StashLimit'].astype(str))
+    
+    # Tree height comparison: one throughput line per tree height, through
+    # every run of that height (runs that differ only in stash limit are
+    # all shown, not averaged)
+    fig = _figure((12, 8))
+    ax = fig.add_subplot()
+    for height, group in df.groupby('TreeHeight'):
+        ax.plot(group['BucketCapacity'].to_numpy(), group['Throughput'].to_numpy(), 'o-',
+                label=f'Tree Height = {height}', linewidth=2, markersize=8)
+    ax.set_title('Impact of Tree Height on Performance', fontsize=16)
+    ax.set_xlabel('Bucket Capacity')
+    ax.set_ylabel('Throughput (ops/sec)')
+    ax.grid(True)
+    ax.legend()
+    fig.savefig('visualizations/tree_height_impact.png', **SAVEFIG_KWARGS)
     print("Saved tree height impact visualization to visualizations/tree_height_impact.png")
-    plt.close()
-    
-    # Group by bucket capacity
-    bucket_groups = df.groupby('BucketCapacity')
-    
-    # Create a plot for bucket capacity comparison
-    plt.figure(figsize=(12, 8))
-    plt.title('Impact of Bucket Capacity on Performance', fontsize=16)
     
-    for capacity, group in bucket_groups:
-        if len(group) > 0:  # Only plot groups with data
-            plt.plot(group['TreeHeight'], group['Throughput'], 'o-', 
-                     label=f'Bucket Capacity = {capacity}', linewidth=2, markersize=8)
-    
-    plt.xlabel('Tree Height')
-    plt.ylabel('Throughput (ops/sec)')
-    plt.grid(True)
-    plt.legend()
-    plt.savefig('visualizations/bucket_capacity_impact.png', dpi=300)
+    # Bucket capacity comparison, one line per bucket capacity
+    fig = _figure((12, 8))
+    ax = fig.add_subplot()
+    for capacity, group in df.groupby('BucketCapacity'):
+        ax.plot(group['TreeHeight'].to_numpy(), group['Throughput'].to_numpy(), 'o-',
+                label=f'Bucket Capacity = {capacity}', linewidth=2, markersize=8)
+    ax.set_title('Impact of Bucket Capacity on Performance', fontsize=16)
+    ax.set_xlabel('Tree Height')
+    ax.set_ylabel('Throughput (ops/sec)')
+    ax.grid(True)
+    ax.legend()
+    fig.savefig('visualizations/bucket_capacity_impact.png', **SAVEFIG_KWARGS)
     print("Saved bucket capacity impact visualization to visualizations/bucket_capacity_impact.png")
-    plt.close()
     
     # Create a heatmap for max stash size
-    plt.figure(figsize=(10, 8))
-    plt.title('Maximum Stash Size by Configuration', fontsize=16)
+    fig = _figure((10, 8))
+    ax = fig.add_subplot()
+    ax.set_title('Maximum Stash Size by Configuration', fontsize=16)
     
     # Filter for specific configurations to create a cleaner heatmap
     pivot_df = df.pivot_table(index='TreeHeight', columns='BucketCapacity', values='MaxStashSize')
+    values = pivot_df.to_numpy()
     
-    # Plot heatmap
-    im = plt.imshow(pivot_df, cmap='YlOrRd')
-    plt.colorbar(im, label='Max Stash Size')
+    # Plot heatmap; one pixel per cell, so skip interpolation
+    im = ax.imshow(values, cmap='YlOrRd', interpolation='nearest')
+    fig.colorbar(im, ax=ax, label='Max Stash Size')
     
     # Set labels
-    plt.xlabel('Bucket Capacity')
-    plt.ylabel('Tree Height')
+    ax.set_xlabel('Bucket Capacity')
+    ax.set_ylabel('Tree Height')
     
     # Set tick labels
-    plt.xticks(range(len(pivot_df.columns)), pivot_df.columns)
-    plt.yticks(range(len(pivot_df.index)), pivot_df.index)
-    
-    # Annotate cells with values
-    for i in range(len(pivot_df.index)):
-        for j in range(len(pivot_df.columns)):
-            if not np.isnan(pivot_df.iloc[i, j]):
-                plt.text(j, i, int(pivot_df.iloc[i, j]), 
-                         ha="center", va="center", color="black" if pivot_df.iloc[i, j] < 100 else "white")
-    
-    plt.tight_layout()
-    plt.savefig('visualizations/stash_size_heatmap.png', dpi=300)
+    ax.set_xticks(range(len(pivot_df.columns)), pivot_df.columns)
+    ax.set_yticks(range(len(pivot_df.index)), pivot_df.index)
+    
+    # Annotate the populated cells with their values
+    mask = ~np.isnan(values)
+    ys, xs = np.nonzero(mask)
+    cell_values = values[mask]
+    colors = np.where(cell_values < 100, 'black', 'white')
+    for x, y, value, color in zip(xs, ys, cell_values.astype(int), colors):
+        ax.text(x, y, value, ha="center", va="center", color=color)
+    
+    fig.savefig('visualizations/stash_size_heatmap.png', **SAVEFIG_KWARGS)
     print("Saved stash size heatmap to visualizations/stash_size_heatmap.png")
-    plt.close()
 
-def analyze_stash_utilization(op_counts):
-    """Analyze stash utilization over time from detailed metrics files"""
-    
-    plt.figure(figsize=(12, 8))
-    plt.title('Stash Size History During Operations', fontsize=16)
-    
+# Per-run detailed metrics files, named by operation count
+DETAIL_FILE_PATTERN = re.compile(r'operations_(\d+)\.csv')
+# The line that opens the stash history section of a detailed metrics file
+STASH_HEADER_PATTERN = re.compile(rb'^[ \t]*Stash Size History[ \t]*\r?$', re.MULTILINE)
+# A stash history value: a line holding only an integer with at most one
+# leading sign. Matched straight against the file buffer, so only the values
+# themselves become Python objects.
+STASH_VALUE_PATTERN = re.compile(rb'^[ \t]*([+-]?\d+)[ \t]*\r?$', re.MULTILINE)
+
+def parse_stash_history(data):
+    """Parse the integers following the 'Stash Size History' header in a bytes-like buffer"""
+    header = STASH_HEADER_PATTERN.search(data)
+    if header is None:
+        return np.empty(0, dtype=np.int64)
+    
+    # Keep only integer lines, skipping blanks and any trailing 'Metric' rows.
+    # Searching from an offset scans an mmap in place instead of copying the
+    # tail of the file out of it.
+    values = STASH_VALUE_PATTERN.findall(data, header.end())
+    return np.array(values, dtype=bytes).astype(np.int64)
+
+def load_stash_histories(op_counts):
+    """Load the stash histories of the detailed metrics files into one array.
+
+    Returns (found_op_counts, values, offsets); the history for
+    found_op_counts[i] is values[offsets[i]:offsets[i + 1]].
+    """
+    # Scan the directory once instead of checking each count; the regex
+    # alone picks out the detailed metrics files
+    with os.scandir('.') as entries:
+        # Keep the matched path so zero-padded names like operations_0100.csv
+        # are opened as found rather than rebuilt from the parsed count
+        available = {int(match.group(1)): entry.path for entry in entries
+                     if (match := DETAIL_FILE_PATTERN.fullmatch(entry.name))}
+    
+    found_op_counts = []
+    histories = []
     for ops in op_counts:
         filename = f"operations_{ops}.csv"
-        if not os.path.exists(filename):
+        if ops not in available:
             print(f"Warning: Detailed metrics file {filename} not found, skipping.")
             continue
         
-        # Read the stash history section
-        stash_history = []
-        with open(filename, 'r') as f:
-            in_stash_section = False
-            for line in f:
-                line = line.strip()
-                if line == "Stash Size History":
-                    in_stash_section = True
-                    continue
-                
-                if in_stash_section and line and not line.startswith("Metric"):
-                    try:
-                        stash_history.append(int(line))
-                    except ValueError:
-                        # Skip non-integer lines
-                        pass
+        # Read the stash history section from a read-only mapping of the file
+        with open(available[ops], 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap cannot map an empty file
+                stash_history = parse_stash_history(b"")
+            else:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    stash_history = parse_stash_history(mm)
         
-        if stash_history:
-            # Plot stash size over time
-            plt.plot(range(len(stash_history)), stash_history, label=f'{ops} Operations')
+        if stash_history.size:
+            found_op_counts.append(ops)
+            histories.append(stash_history)
+    
+    # Pack the ragged histories into one buffer plus start offsets
+    offsets = np.zeros(len(histories) + 1, dtype=np.int64)
+    np.cumsum([history.size for history in histories], out=offsets[1:])
+    values = np.concatenate(histories) if histories else np.empty(0, dtype=np.int64)
+    return found_op_counts, values, offsets
+
+def analyze_stash_utilization(op_counts):
+    """Analyze stash utilization over time from detailed metrics files"""
     
-    plt.xlabel('Operation Count')
-    plt.ylabel('Stash Size')
-    plt.grid(True)
-    plt.legend()
+    found_op_counts, values, offsets = load_stash_histories(op_counts)
+    if not found_op_counts:
+        print("No detailed metrics files found, skipping stash utilization plot.")
+        return
     
-    plt.tight_layout()
-    plt.savefig('visualizations/stash_utilization.png', dpi=300)
+    fig = _figure((12, 8))
+    ax = fig.add_subplot()
+    ax.set_title('Stash Size History During Operations', fontsize=16)
+    
+    # Plot stash size over time: each history's x runs from 0 within its
+    # slice, and all histories are drawn as one LineCollection
+    lengths = np.diff(offsets)
+    xs = np.arange(values.size) - np.repeat(offsets[:-1], lengths)
+    segments = np.split(np.column_stack([xs, values]), offsets[1:-1])
+    cycle_colors = plt.rcParams['axes.prop_cycle'].by_key()['color']
+    colors = [cycle_colors[i % len(cycle_colors)] for i in range(len(segments))]
+    ax.add_collection(LineCollection(segments, colors=colors, linewidths=1.5))
+    ax.autoscale_view()
+    
+    ax.set_xlabel('Operation Count')
+    ax.set_ylabel('Stash Size')
+    ax.grid(True)
+    # A collection has no per-line labels, so the legend uses proxy lines
+    ax.legend(handles=[Line2D([], [], color=color, linewidth=1.5, label=f'{ops} Operations')
+                       for ops, color in zip(found_op_counts, colors)])
+    
+    fig.savefig('visualizations/stash_utilization.png', **SAVEFIG_KWARGS)
     print("Saved stash utilization visualization to visualizations/stash_utilization.png")
-    plt.close()
+
+# Visualization types selectable from the command line
+ANALYSES = {
+    'operations': analyze_operations_benchmark,
+    'baseline': analyze_baseline_comparison,
+    'config': analyze_configuration_benchmark,
+}
+
+# Input files (glob patterns) each analysis reads; its outputs are only
+# regenerated when one of these changes
+ANALYSIS_INPUTS = {
+    'operations': ['operations_benchmark.csv', 'operations_[0-9]*.csv'],
+    'baseline': ['baseline_comparison.csv'],
+    'config': ['config_benchmark_results.csv'],
+}
+
+# Output files (glob patterns) each analysis may write; the radar profiles
+# and stash history plot depend on which operation counts are present
+ANALYSIS_OUTPUTS = {
+    'operations': ['operations_benchmark.png', 'throughput_*.png',
+                   'radar_profile_*_ops.png', 'stash_utilization.png'],
+    'baseline': ['baseline_comparison.png'],
+    'config': ['tree_height_impact.png', 'bucket_capacity_impact.png',
+               'stash_size_heatmap.png'],
+}
+
+# Input signatures and written outputs of the last successful run of each analysis
+VIZ_CACHE_FILE = os.path.join("visualizations", ".viz_cache.json")
+
+def _input_signature(name):
+    """Signature of the render settings, this script and an analysis' inputs"""
+    paths = [os.path.abspath(__file__)]
+    for pattern in ANALYSIS_INPUTS[name]:
+        paths.extend(sorted(glob.glob(pattern)))
+    
+    signature = [f"savefig:{SAVEFIG_KWARGS!r}"]
+    for path in paths:
+        st = os.stat(path)
+        signature.append(f"{path}:{st.st_mtime_ns}:{st.st_size}")
+    return signature
+
+def _written_outputs(name, since_ns):
+    """Output files of an analysis that were written at or after since_ns"""
+    outputs = []
+    for pattern in ANALYSIS_OUTPUTS[name]:
+        for path in sorted(glob.glob(os.path.join("visualizations", pattern))):
+            if os.stat(path).st_mtime_ns >= since_ns:
+                outputs.append(path)
+    return outputs
+
+def _is_up_to_date(entry, signature):
+    """Whether a cache entry matches the signature and all its outputs still exist"""
+    return (isinstance(entry, dict)
+            and entry.get('signature') == signature
+            and bool(entry.get('outputs'))
+            and all(os.path.exists(path) for path in entry['outputs']))
+
+def load_viz_cache():
+    """Load the cached input signatures, or an empty cache"""
+    try:
+        with open(VIZ_CACHE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_viz_cache(cache):
+    """Write the input signatures of the analyses that have run"""
+    with open(VIZ_CACHE_FILE, 'w') as f:
+        json.dump(cache, f, indent=2)
+
+def _run(name):
+    """Run one named analysis (module-level so worker processes can pickle it)"""
+    ANALYSES[name]()
 
 if __name__ == "__main__":
     print("NDN Router Performance Visualizer")
     
-    # Create visualizations directory
+    # Create the visualization directory once; the analyses and their
+    # worker processes all write into it
     os.makedirs("visualizations", exist_ok=True)
     
-    if len(sys.argv) > 1:
+    # --force regenerates every requested visualization, ignoring the cache
+    args = sys.argv[1:]
+    force = '--force' in args
+    args = [arg for arg in args if arg != '--force']
+    
+    if args:
         # Process specific visualization based on argument
-        if sys.argv[1] == "operations":
-            analyze_operations_benchmark()
-        elif sys.argv[1] == "baseline":
-            analyze_baseline_comparison()
-        elif sys.argv[1] == "config":
-            analyze_configuration_benchmark()
-        else:
-            print(f"Unknown visualization type: {sys.argv[1]}")
-            print("Available types: operations, baseline, config")
+        if args[0] not in ANALYSES:
+            print(f"Unknown visualization type: {args[0]}")
+            print("Available types: operations, baseline, config (add --force to ignore the cache)")
+            sys.exit(1)
+        names = [args[0]]
     else:
-        # Process all visualizations
         print("Generating all visualizations...")
-        analyze_operations_benchmark()
-        analyze_baseline_comparison()
-        analyze_configuration_benchmark()
-        print("Visualization complete!")
\ No newline at end of file
+        names = list(ANALYSES)
+    
+    # Skip analyses whose inputs and settings are unchanged since their last
+    # run, as long as everything that run wrote is still there
+    cache = load_viz_cache()
+    pending = {}
+    for name in names:
+        signature = _input_signature(name)
+        if not force and _is_up_to_date(cache.get(name), signature):
+            print(f"Skipping {name} visualizations: inputs unchanged since last run")
+        else:
+            pending[name] = signature
+    
+    # Outputs written from here on belong to this run; step back a little
+    # for filesystems with coarse timestamps
+    run_start_ns = time.time_ns() - 2_000_000_000
+    if len(pending) == 1:
+        _run(next(iter(pending)))
+    elif pending:
+        # The analyses read separate CSVs and write separate PNGs, so they
+        # can run in parallel processes
+        with ProcessPoolExecutor(max_workers=min(len(pending), os.cpu_count() or 1)) as executor:
+            list(executor.map(_run, pending))
+    
+    # Only record signatures once every pending analysis has finished
+    if pending:
+        for name, signature in pending.items():
+            cache[name] = {'signature': signature,
+                           'outputs': _written_outputs(name, run_start_ns)}
+        save_viz_cache(cache)
+    print("Visualization complete!")